@@ -0,0 +1,168 @@
+import tkinter as tk
+import argparse
+import os
+import sys
+from functools import partial
+import warnings
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from minesweeper.bitboard import BitboardEngine
+from minesweeper.cache import CachedPolicy
+from minesweeper.engine import MinesweeperEngine
+from minesweeper.evaluate import play_games, print_cache_statistics, print_statistics
+from minesweeper.lockstep import simulate
+from minesweeper.lookup import LookupPolicy
+from minesweeper.parallel import parallel_evaluate
+from minesweeper.registry import get_policy
+
+warnings.simplefilter(action='ignore', category=UserWarning)
+
+def load_policy(lookup=False, cache=None, report=False):
+    policy = get_policy("incremental", report)
+    if lookup:
+        return LookupPolicy(policy)
+    return CachedPolicy(policy, cache) if cache else policy
+
+class MinesweeperAI:
+    def __init__(self, root, rows=4, columns=4, mines=3, games_to_play=1000, lookup=False, cache=None):
+        self.root = root
+        self.rows = rows
+        self.columns = columns
+        self.mines = mines
+        self.games_to_play = games_to_play
+        self.current_game = 0
+        self.wins = 0
+        self.total_moves = 0
+        self.safe_moves = 0
+        self.buttons = []
+        self.engine = MinesweeperEngine(rows, columns, mines)
+
+        self.policy = load_policy(lookup, cache)
+
+        self.create_buttons()
+        self.play_games()
+
+    def create_buttons(self):
+        for r in range(self.rows):
+            row_buttons = []
+            for c in range(self.columns):
+                button = tk.Button(self.root, width=2, command=lambda r=r, c=c: self.reveal_cell(r, c))
+                button.bind("<Button-3>", lambda event, r=r, c=c: self.flag_cell(r, c))
+                button.grid(row=r, column=c)
+                row_buttons.append(button)
+            self.buttons.append(row_buttons)
+
+    def replay_button(self):
+        replay_button = tk.Button(self.root, text="Replay", command=self.reset_game)
+        replay_button.grid(row=self.rows, column=0, columnspan=self.columns)
+
+    def ai_move_button(self):
+        ai_button = tk.Button(self.root, text="AI Move", command=self.ai_move)
+        ai_button.grid(row=self.rows+1, column=0, columnspan=self.columns)
+
+    def reveal_cell(self, r, c):
+        opened = self.engine.reveal(r, c)
+        if not opened:
+            return
+
+        self.total_moves += len(opened)
+        for i, j in opened:
+            if self.engine.board[i, j] == -1:
+                self.buttons[i][j].config(text="*", bg="red")
+            else:
+                self.safe_moves += 1
+                self.buttons[i][j].config(text=str(self.engine.board[i, j]), bg="lightgrey", state="disabled")
+
+        if self.engine.game_over:
+            if self.engine.won:
+                self.wins += 1
+            self.root.after(100, self.reset_game)
+
+    def flag_cell(self, r, c):
+        if self.engine.game_over or self.engine.revealed[r, c]:
+            return
+        if self.engine.flag(r, c):
+            self.buttons[r][c].config(text="F", bg="yellow")
+        else:
+            self.buttons[r][c].config(text="", bg="SystemButtonFace")
+
+    def reveal_mines(self):
+        for r, c in self.engine.mine_locations:
+            self.buttons[r][c].config(text="*", bg="red")
+
+    def reset_game(self):
+        self.current_game += 1
+        if self.current_game > self.games_to_play:
+            self.print_statistics()
+            self.root.quit()
+            return
+
+        self.buttons = []
+        self.engine.reset()
+        for widget in self.root.winfo_children():
+            widget.destroy()
+        self.create_buttons()
+        self.root.after(100, self.ai_move)
+
+    def ai_move(self):
+        if self.engine.game_over:
+            return
+
+        best_move = self.policy.best_move(self.engine)
+
+        if best_move:
+            self.reveal_cell(best_move[0], best_move[1])
+            if not self.engine.game_over:  # oyun bitene kadar hamle yap
+                self.root.after(100, self.ai_move)
+
+    def print_statistics(self):
+        win_percentage = (self.wins / self.games_to_play) * 100
+        safe_move_percentage = (self.safe_moves / self.total_moves) * 100
+        print(f"Games played: {self.games_to_play}")
+        print(f"Games won: {self.wins}")
+        print(f"Win percentage: {win_percentage:.2f}%")
+        print(f"Safe move percentage: {safe_move_percentage:.2f}%")
+        if isinstance(self.policy, CachedPolicy):
+            print_cache_statistics(self.policy)
+
+    def play_games(self):
+        self.root.after(100, self.ai_move)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--turbo", action="store_true", help="arayuz olmadan, beklemeden oyna")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--lockstep", action="store_true", help="oyunlari gruplar halinde ayni anda oyna")
+    parser.add_argument("--batch-size", type=int, default=4096)
+    parser.add_argument("--workers", type=int, help="oyunlari islemlere bolerek paralel oyna")
+    parser.add_argument("--bitboard", action="store_true", help="turbo modda bit maskeli oyun durumu kullan")
+    parser.add_argument("--lookup", action="store_true", help="modeli bastan tum ozellik vektorleri icin skorla, hamlede tablodan oku")
+    parser.add_argument("--cache", type=int, help="model skorlarini bu boyutta LRU onbellekte tut")
+    parser.add_argument("--timings", action="store_true", help="import, yukleme ve isinma surelerini yazdir")
+    args = parser.parse_args()
+    load = partial(load_policy, lookup=args.lookup, cache=args.cache, report=args.timings)
+
+    if args.workers:
+        stats = parallel_evaluate(load, args.games, workers=args.workers, seed=args.seed,
+                                  lockstep=args.lockstep, batch_size=args.batch_size)
+        print_statistics(stats)
+    elif args.lockstep:
+        policy = load()
+        stats = simulate(policy, args.games, batch_size=args.batch_size, seed=args.seed)
+        print_statistics(stats)
+        if args.cache:
+            print_cache_statistics(policy)
+    elif args.turbo:
+        engine = BitboardEngine() if args.bitboard else MinesweeperEngine()
+        policy = load()
+        stats = play_games(engine, policy, args.games, seed=args.seed)
+        print_statistics(stats)
+        if args.cache:
+            print_cache_statistics(policy)
+    else:
+        root = tk.Tk()
+        root.title("Minesweeper AI")
+        game = MinesweeperAI(root, games_to_play=args.games, lookup=args.lookup, cache=args.cache)
+        root.mainloop()
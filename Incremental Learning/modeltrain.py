@@ -0,0 +1,41 @@
+import argparse
+import os
+import sys
+import time
+import joblib
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from minesweeper.datastore import DatasetReader, data_path
+from minesweeper.features import Featurizer
+from minesweeper.incremental import CHUNK_ROWS, LEARNERS, train_incremental
+from minesweeper.metadata import save_metadata
+from minesweeper.registry import model_path
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--radius", type=int, default=1, help="ozellik penceresinin yaricapi")
+parser.add_argument("--layout", default="legacy", choices=["legacy", "padded"])
+parser.add_argument("--learner", default="sgd", choices=LEARNERS, help="partial_fit destekleyen model")
+parser.add_argument("--epochs", type=int, default=5, help="sgd ve mlp icin veri uzerinden gecis sayisi")
+parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="bellege ayni anda alinacak satir sayisi")
+args = parser.parse_args()
+featurizer = Featurizer(args.radius, args.layout)
+
+# veriyi parca parca oku, tamami bellege alinmaz
+dataset = DatasetReader(data_path(args.radius, args.layout))
+
+if dataset.n_features != featurizer.n_features:
+    raise ValueError(f"expected {featurizer.n_features} features for radius {args.radius}, got {dataset.n_features}")
+
+# modeli egit
+start = time.perf_counter()
+model, accuracy = train_incremental(dataset, args.learner, args.epochs, args.chunk_rows)
+training_time = time.perf_counter() - start
+print(f"Training time: {training_time:.1f}s")
+
+# kaydet
+joblib.dump(model, model_path("incremental"))
+save_metadata(model_path("incremental"), training_time=round(training_time, 2), learner=args.learner,
+              **featurizer.metadata())
+
+print(f"Model accuracy: {accuracy}")
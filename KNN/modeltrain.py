@@ -1,26 +1,44 @@
-import pandas as pd
+import argparse
+import os
+import sys
+import time
 from sklearn.model_selection import train_test_split
 from sklearn.neighbors import KNeighborsClassifier
 import joblib
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from minesweeper.datastore import DatasetReader, data_path
+from minesweeper.features import Featurizer
+from minesweeper.metadata import save_metadata
+from minesweeper.registry import model_path
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--radius", type=int, default=1, help="ozellik penceresinin yaricapi")
+parser.add_argument("--layout", default="legacy", choices=["legacy", "padded"])
+args = parser.parse_args()
+featurizer = Featurizer(args.radius, args.layout)
+
 # veriyi yukle
-data = pd.read_csv("minesweeper_data.csv")
+dataset = DatasetReader(data_path(args.radius, args.layout))
 
-if data.isnull().values.any():
-    print("Data contains missing values. Cleaning data...")
-    data = data.dropna()
+if dataset.n_features != featurizer.n_features:
+    raise ValueError(f"expected {featurizer.n_features} features for radius {args.radius}, got {dataset.n_features}")
 
-X = data.iloc[:, :-1]  # Features
-y = data.iloc[:, -1]   # Labels
+X, y = dataset.load()  # Features, Labels
 
 # veriyi ayir
 X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
 # modeli egit
 model = KNeighborsClassifier(n_neighbors=5)
+start = time.perf_counter()
 model.fit(X_train, y_train)
+training_time = time.perf_counter() - start
+print(f"Training time: {training_time:.1f}s")
 
 # kaydet
-joblib.dump(model, "minesweeper_knn_model.pkl")
+joblib.dump(model, model_path("knn"))
+save_metadata(model_path("knn"), training_time=round(training_time, 2), **featurizer.metadata())
 
 print(f"Model accuracy: {model.score(X_test, y_test)}")
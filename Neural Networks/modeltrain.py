@@ -1,44 +1,105 @@
-import pandas as pd
+import argparse
+import os
+import sys
+import time
 import numpy as np
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 from keras.models import Sequential
 from keras.layers import Dense
 from keras.models import load_model
+from keras.callbacks import EarlyStopping, ModelCheckpoint
 import joblib
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from minesweeper.datastore import DatasetReader, data_path
+from minesweeper.dedup import deduplicate
+from minesweeper.features import Featurizer
+from minesweeper.metadata import save_metadata
+from minesweeper.mlp import export_mlp
+from minesweeper.pipeline import fit_scaler, make_dataset, tune_batch_size
+from minesweeper.registry import model_path
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--radius", type=int, default=1, help="ozellik penceresinin yaricapi")
+parser.add_argument("--layout", default="legacy", choices=["legacy", "padded"])
+parser.add_argument("--dedup", action="store_true", help="tekrar eden satirlari birlestirip sayilarla agirliklandir")
+parser.add_argument("--epochs", type=int, default=50)
+parser.add_argument("--fast", action="store_true", help="tf.data, buyuk yigin, erken durdurma ve en iyi modeli kaydetme")
+parser.add_argument("--batch-size", type=int, help="--fast icin yigin boyutu (verilmezse hiz olculerek secilir)")
+parser.add_argument("--patience", type=int, default=5, help="--fast icin val_loss iyilesmeden beklenecek epoch sayisi")
+args = parser.parse_args()
+featurizer = Featurizer(args.radius, args.layout)
+
 # veriyi yukle
-data = pd.read_csv("minesweeper_data.csv")
+dataset = DatasetReader(data_path(args.radius, args.layout))
 
-if data.isnull().values.any():
-    print("Data contains missing values. Cleaning data...")
-    data = data.dropna()
+if dataset.n_features != featurizer.n_features:
+    raise ValueError(f"expected {featurizer.n_features} features for radius {args.radius}, got {dataset.n_features}")
 
-X = data.iloc[:, :-1].values  # Features
-y = data.iloc[:, -1].values   # Labels
+if args.fast:
+    # depo bellege alinmaz; olcekleyici parca parca, ayrim incremental.stream ile ayni
+    scaler = fit_scaler(dataset)
+    train_rows = int(scaler.n_samples_seen_)
+else:
+    X, y = dataset.load()  # Features, Labels
 
-# veriyi ayir
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    # veriyi ayir
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
-# normalize et
-scaler = StandardScaler()
-X_train = scaler.fit_transform(X_train)
-X_test = scaler.transform(X_test)
+    weights = None
+    if args.dedup:
+        # tekrar eden (ozellik, etiket) satirlarini tek satir + agirlik yap
+        rows = len(y_train)
+        X_train, y_train, weights = deduplicate(X_train, y_train)
+        print(f"Deduplicated {rows} training rows to {len(y_train)} unique rows")
+
+    # normalize et
+    scaler = StandardScaler()
+    scaler.fit(X_train, sample_weight=weights)
+    train_rows = len(y_train)
 
 # yapay sinir aglarini kur
-model = Sequential()
-model.add(Dense(64, input_dim=X_train.shape[1], activation='relu'))
-model.add(Dense(32, activation='relu'))
-model.add(Dense(1, activation='sigmoid'))
+def build_model():
+    model = Sequential()
+    model.add(Dense(64, input_dim=dataset.n_features, activation='relu'))
+    model.add(Dense(32, activation='relu'))
+    model.add(Dense(1, activation='sigmoid'))
+
+    model.compile(loss='binary_crossentropy', optimizer='adam', metrics=['accuracy'])
+    return model
 
-model.compile(loss='binary_crossentropy', optimizer='adam', metrics=['accuracy'])
+model = build_model()
 
 # modeli egit
-model.fit(X_train, y_train, epochs=50, batch_size=10, validation_data=(X_test, y_test))
+if args.fast:
+    # tf.data yiginlari, olculerek secilen yigin boyutu, val_loss iyilesmeyince dur, en iyi modeli kaydet
+    batch_size = args.batch_size or tune_batch_size(build_model, dataset, scaler, train_rows)
+    print(f"Batch size: {batch_size}")
+    train = make_dataset(dataset, scaler, batch_size, dedup=args.dedup, shuffle=True)
+    validation = make_dataset(dataset, scaler, batch_size, validation=True)
+    callbacks = [EarlyStopping(monitor="val_loss", patience=args.patience, restore_best_weights=True),
+                 ModelCheckpoint(model_path("nn"), monitor="val_loss", save_best_only=True)]
+    start = time.perf_counter()
+    history = model.fit(train, validation_data=validation, epochs=args.epochs, callbacks=callbacks)
+else:
+    start = time.perf_counter()
+    history = model.fit(scaler.transform(X_train), y_train, sample_weight=weights, epochs=args.epochs, batch_size=10,
+                        validation_data=(scaler.transform(X_test), y_test))
+training_time = time.perf_counter() - start
+epochs = len(history.history["loss"])
+print(f"Training time: {training_time:.1f}s")
+print(f"Samples per second: {epochs * train_rows / training_time:.0f} ({epochs} epochs)")
 
 # kaydet
-model.save("minesweeper_nn_model.h5")
-joblib.dump(scaler, "scaler.pkl")
+model.save(model_path("nn"))
+joblib.dump(scaler, os.path.join(os.path.dirname(model_path("nn")), "scaler.pkl"))
+save_metadata(model_path("nn"), training_time=round(training_time, 2), **featurizer.metadata())
+export_mlp(model, scaler).save(model_path("nn-numpy"))  # TensorFlow'suz degerlendirme icin
 
-_, accuracy = model.evaluate(X_test, y_test)
+if args.fast:
+    _, accuracy = model.evaluate(validation)
+else:
+    _, accuracy = model.evaluate(scaler.transform(X_test), y_test)
 print(f"Model accuracy: {accuracy}")
@@ -1,8 +1,14 @@
 import tkinter as tk
-import random
-import joblib
-import numpy as np
-from keras.models import load_model
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from minesweeper.engine import MinesweeperEngine
+from minesweeper.registry import get_policy
+
+def load_policy():
+    return get_policy("nn")
 
 class MinesweeperAI:
     def __init__(self, root, rows=4, columns=4, mines=3):
@@ -11,33 +17,14 @@ class MinesweeperAI:
         self.columns = columns
         self.mines = mines
         self.buttons = []
-        self.board = []
-        self.mine_locations = set()
-        self.game_over = False
-        self.first_click = True
+        self.engine = MinesweeperEngine(rows, columns, mines)
 
-        self.model = load_model("minesweeper_nn_model.h5")
-        self.scaler = joblib.load("scaler.pkl")
+        self.policy = load_policy()
 
-        self.create_board()
         self.create_buttons()
         self.replay_button()
         self.ai_move_button()
 
-    def create_board(self):
-        self.board = [[0 for _ in range(self.columns)] for _ in range(self.rows)]
-
-    def place_mines(self, first_click_r, first_click_c):
-        mines_placed = 0
-        while mines_placed < self.mines:
-            row = random.randint(0, self.rows - 1)
-            col = random.randint(0, self.columns - 1)
-            if (row, col) != (first_click_r, first_click_c) and self.board[row][col] != -1:
-                self.board[row][col] = -1
-                self.mine_locations.add((row, col))
-                mines_placed += 1
-        self.update_counts()
-
     def create_buttons(self):
         for r in range(self.rows):
             row_buttons = []
@@ -56,98 +43,44 @@ class MinesweeperAI:
         ai_button = tk.Button(self.root, text="AI Move", command=self.ai_move)
         ai_button.grid(row=self.rows+1, column=0, columnspan=self.columns)
 
-    def update_counts(self):
-        for r in range(self.rows):
-            for c in range(self.columns):
-                if self.board[r][c] == -1:
-                    continue
-                count = 0
-                for i in range(max(0, r - 1), min(self.rows, r + 2)):
-                    for j in range(max(0, c - 1), min(self.columns, c + 2)):
-                        if self.board[i][j] == -1:
-                            count += 1
-                self.board[r][c] = count
-
     def reveal_cell(self, r, c):
-        if self.game_over or self.buttons[r][c]["state"] == "disabled" or self.buttons[r][c]["text"] == "F":
-            return
-        if self.first_click:
-            self.first_click = False
-            self.place_mines(r, c)
-
-        if self.board[r][c] == -1:
-            self.buttons[r][c].config(text="*", bg="red")
-            self.game_over = True
-            print("You hit a mine!")
-            self.reveal_mines()
-        else:
-            self.buttons[r][c].config(text=str(self.board[r][c]), bg="lightgrey", state="disabled")
-            if self.board[r][c] == 0:
-                for i in range(max(0, r - 1), min(self.rows, r + 2)):
-                    for j in range(max(0, c - 1), min(self.columns, c + 2)):
-                        if self.buttons[i][j]["state"] != "disabled":
-                            self.reveal_cell(i, j)
-            self.check_win()
+        opened = self.engine.reveal(r, c)
+        for i, j in opened:
+            if self.engine.board[i, j] == -1:
+                self.buttons[i][j].config(text="*", bg="red")
+            else:
+                self.buttons[i][j].config(text=str(self.engine.board[i, j]), bg="lightgrey", state="disabled")
+
+        if opened and self.engine.game_over:
+            if self.engine.won:
+                print("You won!")
+            else:
+                print("You hit a mine!")
+                self.reveal_mines()
 
     def flag_cell(self, r, c):
-        if self.game_over or self.buttons[r][c]["state"] == "disabled":
+        if self.engine.game_over or self.engine.revealed[r, c]:
             return
-        if self.buttons[r][c]["text"] == "F":
-            self.buttons[r][c].config(text="", bg="SystemButtonFace")
-        else:
+        if self.engine.flag(r, c):
             self.buttons[r][c].config(text="F", bg="yellow")
+        else:
+            self.buttons[r][c].config(text="", bg="SystemButtonFace")
 
     def reveal_mines(self):
-        for r, c in self.mine_locations:
+        for r, c in self.engine.mine_locations:
             self.buttons[r][c].config(text="*", bg="red")
 
-    def check_win(self):
-        for r in range(self.rows):
-            for c in range(self.columns):
-                if self.board[r][c] != -1 and self.buttons[r][c]["state"] != "disabled":
-                    return
-        print("You won!")
-        self.game_over = True
-
     def reset_game(self):
-        self.board = []
         self.buttons = []
-        self.mine_locations = set()
-        self.game_over = False
-        self.first_click = True
+        self.engine.reset()
         for widget in self.root.winfo_children():
             widget.destroy()
-        self.create_board()
         self.create_buttons()
         self.replay_button()
         self.ai_move_button()
 
-    def get_features(self, r, c):
-        features = []
-        for i in range(max(0, r - 1), min(self.rows, r + 2)):
-            for j in range(max(0, c - 1), min(self.columns, c + 2)):
-                if i == r and j == c:
-                    continue
-                features.append(self.board[i][j])
-        # uzunlugun 8 oldugunu kontrol
-        while len(features) < 8:
-            features.append(-1)
-        return features
-
     def ai_move(self):
-        best_move = None
-        best_prob = -1
-
-        for r in range(self.rows):
-            for c in range(self.columns):
-                if self.buttons[r][c]["state"] == "disabled" or self.buttons[r][c]["text"] == "F":
-                    continue
-                features = self.get_features(r, c)
-                features = self.scaler.transform(np.array(features).reshape(1, -1))  # Normalize features
-                prob = self.model.predict(features)[0][0]
-                if prob > best_prob:
-                    best_prob = prob
-                    best_move = (r, c)
+        best_move = self.policy.best_move(self.engine)
 
         if best_move:
             self.reveal_cell(best_move[0], best_move[1])
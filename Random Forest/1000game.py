@@ -1,13 +1,31 @@
 import tkinter as tk
-import random
-import joblib
-import numpy as np
+import argparse
+import os
+import sys
+from functools import partial
 import warnings
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from minesweeper.bitboard import BitboardEngine
+from minesweeper.cache import CachedPolicy
+from minesweeper.engine import MinesweeperEngine
+from minesweeper.evaluate import play_games, print_cache_statistics, print_statistics
+from minesweeper.lockstep import simulate
+from minesweeper.lookup import LookupPolicy
+from minesweeper.parallel import parallel_evaluate
+from minesweeper.registry import get_policy
+
 warnings.simplefilter(action='ignore', category=UserWarning)
 
+def load_policy(lookup=False, cache=None, report=False, compiled=False):
+    policy = get_policy("rf-compiled" if compiled else "rf", report)
+    if lookup:
+        return LookupPolicy(policy)
+    return CachedPolicy(policy, cache) if cache else policy
+
 class MinesweeperAI:
-    def __init__(self, root, rows=4, columns=4, mines=3, games_to_play=1000):
+    def __init__(self, root, rows=4, columns=4, mines=3, games_to_play=1000, lookup=False, cache=None):
         self.root = root
         self.rows = rows
         self.columns = columns
@@ -18,31 +36,13 @@ class MinesweeperAI:
         self.total_moves = 0
         self.safe_moves = 0
         self.buttons = []
-        self.board = []
-        self.mine_locations = set()
-        self.game_over = False
-        self.first_click = True
+        self.engine = MinesweeperEngine(rows, columns, mines)
 
-        self.model = joblib.load("minesweeper_model.pkl")
+        self.policy = load_policy(lookup, cache)
 
-        self.create_board()
         self.create_buttons()
         self.play_games()
 
-    def create_board(self):
-        self.board = [[0 for _ in range(self.columns)] for _ in range(self.rows)]
-
-    def place_mines(self, first_click_r, first_click_c):
-        mines_placed = 0
-        while mines_placed < self.mines:
-            row = random.randint(0, self.rows - 1)
-            col = random.randint(0, self.columns - 1)
-            if (row, col) != (first_click_r, first_click_c) and self.board[row][col] != -1:
-                self.board[row][col] = -1
-                self.mine_locations.add((row, col))
-                mines_placed += 1
-        self.update_counts()
-
     def create_buttons(self):
         for r in range(self.rows):
             row_buttons = []
@@ -61,62 +61,36 @@ class MinesweeperAI:
         ai_button = tk.Button(self.root, text="AI Move", command=self.ai_move)
         ai_button.grid(row=self.rows+1, column=0, columnspan=self.columns)
 
-    def update_counts(self):
-        for r in range(self.rows):
-            for c in range(self.columns):
-                if self.board[r][c] == -1:
-                    continue
-                count = 0
-                for i in range(max(0, r - 1), min(self.rows, r + 2)):
-                    for j in range(max(0, c - 1), min(self.columns, c + 2)):
-                        if self.board[i][j] == -1:
-                            count += 1
-                self.board[r][c] = count
-
     def reveal_cell(self, r, c):
-        if self.game_over or self.buttons[r][c]["state"] == "disabled" or self.buttons[r][c]["text"] == "F":
+        opened = self.engine.reveal(r, c)
+        if not opened:
             return
-        if self.first_click:
-            self.first_click = False
-            self.place_mines(r, c)
-
-        self.total_moves += 1
 
-        if self.board[r][c] == -1:
-            self.buttons[r][c].config(text="*", bg="red")
-            self.game_over = True
+        self.total_moves += len(opened)
+        for i, j in opened:
+            if self.engine.board[i, j] == -1:
+                self.buttons[i][j].config(text="*", bg="red")
+            else:
+                self.safe_moves += 1
+                self.buttons[i][j].config(text=str(self.engine.board[i, j]), bg="lightgrey", state="disabled")
+
+        if self.engine.game_over:
+            if self.engine.won:
+                self.wins += 1
             self.root.after(100, self.reset_game)
-        else:
-            self.safe_moves += 1
-            self.buttons[r][c].config(text=str(self.board[r][c]), bg="lightgrey", state="disabled")
-            if self.board[r][c] == 0:
-                for i in range(max(0, r - 1), min(self.rows, r + 2)):
-                    for j in range(max(0, c - 1), min(self.columns, c + 2)):
-                        if self.buttons[i][j]["state"] != "disabled":
-                            self.reveal_cell(i, j)
-            self.check_win()
 
     def flag_cell(self, r, c):
-        if self.game_over or self.buttons[r][c]["state"] == "disabled":
+        if self.engine.game_over or self.engine.revealed[r, c]:
             return
-        if self.buttons[r][c]["text"] == "F":
-            self.buttons[r][c].config(text="", bg="SystemButtonFace")
-        else:
+        if self.engine.flag(r, c):
             self.buttons[r][c].config(text="F", bg="yellow")
+        else:
+            self.buttons[r][c].config(text="", bg="SystemButtonFace")
 
     def reveal_mines(self):
-        for r, c in self.mine_locations:
+        for r, c in self.engine.mine_locations:
             self.buttons[r][c].config(text="*", bg="red")
 
-    def check_win(self):
-        for r in range(self.rows):
-            for c in range(self.columns):
-                if self.board[r][c] != -1 and self.buttons[r][c]["state"] != "disabled":
-                    return
-        self.wins += 1
-        self.game_over = True
-        self.root.after(100, self.reset_game)
-
     def reset_game(self):
         self.current_game += 1
         if self.current_game > self.games_to_play:
@@ -124,50 +98,22 @@ class MinesweeperAI:
             self.root.quit()
             return
 
-        self.board = []
         self.buttons = []
-        self.mine_locations = set()
-        self.game_over = False
-        self.first_click = True
+        self.engine.reset()
         for widget in self.root.winfo_children():
             widget.destroy()
-        self.create_board()
         self.create_buttons()
         self.root.after(100, self.ai_move)
 
-    def get_features(self, r, c):
-        features = []
-        for i in range(max(0, r - 1), min(self.rows, r + 2)):
-            for j in range(max(0, c - 1), min(self.columns, c + 2)):
-                if i == r and j == c:
-                    continue
-                features.append(self.board[i][j])
-        # uzunlugun 8 oldugunu kontrol
-        while len(features) < 8:
-            features.append(-1)
-        return features
-
     def ai_move(self):
-        if self.game_over:
+        if self.engine.game_over:
             return
 
-        best_move = None
-        best_prob = -1
-
-        for r in range(self.rows):
-            for c in range(self.columns):
-                if self.buttons[r][c]["state"] == "disabled" or self.buttons[r][c]["text"] == "F":
-                    continue
-                features = self.get_features(r, c)
-                features = np.array(features).reshape(1, -1)
-                prob = self.model.predict_proba(features)[0][1]
-                if prob > best_prob:
-                    best_prob = prob
-                    best_move = (r, c)
+        best_move = self.policy.best_move(self.engine)
 
         if best_move:
             self.reveal_cell(best_move[0], best_move[1])
-            if not self.game_over:  # oyun bitene kadar hamle yap
+            if not self.engine.game_over:  # oyun bitene kadar hamle yap
                 self.root.after(100, self.ai_move)
 
     def print_statistics(self):
@@ -177,12 +123,47 @@ class MinesweeperAI:
         print(f"Games won: {self.wins}")
         print(f"Win percentage: {win_percentage:.2f}%")
         print(f"Safe move percentage: {safe_move_percentage:.2f}%")
+        if isinstance(self.policy, CachedPolicy):
+            print_cache_statistics(self.policy)
 
     def play_games(self):
         self.root.after(100, self.ai_move)
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    root.title("Minesweeper AI")
-    game = MinesweeperAI(root, games_to_play=1000)
-    root.mainloop()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--turbo", action="store_true", help="arayuz olmadan, beklemeden oyna")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--lockstep", action="store_true", help="oyunlari gruplar halinde ayni anda oyna")
+    parser.add_argument("--batch-size", type=int, default=4096)
+    parser.add_argument("--workers", type=int, help="oyunlari islemlere bolerek paralel oyna")
+    parser.add_argument("--bitboard", action="store_true", help="turbo modda bit maskeli oyun durumu kullan")
+    parser.add_argument("--lookup", action="store_true", help="modeli bastan tum ozellik vektorleri icin skorla, hamlede tablodan oku")
+    parser.add_argument("--cache", type=int, help="model skorlarini bu boyutta LRU onbellekte tut")
+    parser.add_argument("--timings", action="store_true", help="import, yukleme ve isinma surelerini yazdir")
+    parser.add_argument("--compiled", action="store_true", help="ormani dizi tabanli degerlendiriciyle skorla")
+    args = parser.parse_args()
+    load = partial(load_policy, lookup=args.lookup, cache=args.cache, report=args.timings, compiled=args.compiled)
+
+    if args.workers:
+        stats = parallel_evaluate(load, args.games, workers=args.workers, seed=args.seed,
+                                  lockstep=args.lockstep, batch_size=args.batch_size)
+        print_statistics(stats)
+    elif args.lockstep:
+        policy = load()
+        stats = simulate(policy, args.games, batch_size=args.batch_size, seed=args.seed)
+        print_statistics(stats)
+        if args.cache:
+            print_cache_statistics(policy)
+    elif args.turbo:
+        engine = BitboardEngine() if args.bitboard else MinesweeperEngine()
+        policy = load()
+        stats = play_games(engine, policy, args.games, seed=args.seed)
+        print_statistics(stats)
+        if args.cache:
+            print_cache_statistics(policy)
+    else:
+        root = tk.Tk()
+        root.title("Minesweeper AI")
+        game = MinesweeperAI(root, games_to_play=args.games, lookup=args.lookup, cache=args.cache)
+        root.mainloop()
@@ -1,26 +1,55 @@
-import pandas as pd
+import argparse
+import os
+import sys
+import time
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
 import joblib
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from minesweeper.datastore import DatasetReader, data_path
+from minesweeper.dedup import deduplicate
+from minesweeper.features import Featurizer
+from minesweeper.forest import compile_forest
+from minesweeper.metadata import save_metadata
+from minesweeper.registry import model_path
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--radius", type=int, default=1, help="ozellik penceresinin yaricapi")
+parser.add_argument("--layout", default="legacy", choices=["legacy", "padded"])
+parser.add_argument("--dedup", action="store_true", help="tekrar eden satirlari birlestirip sayilarla agirliklandir")
+args = parser.parse_args()
+featurizer = Featurizer(args.radius, args.layout)
+
 # veriyi yukle
-data = pd.read_csv("minesweeper_data.csv")
+dataset = DatasetReader(data_path(args.radius, args.layout))
 
-if data.isnull().values.any():
-    print("Data contains missing values. Cleaning data...")
-    data = data.dropna()
+if dataset.n_features != featurizer.n_features:
+    raise ValueError(f"expected {featurizer.n_features} features for radius {args.radius}, got {dataset.n_features}")
 
-X = data.iloc[:, :-1]  # Features
-y = data.iloc[:, -1]   # Labels
+X, y = dataset.load()  # Features, Labels
 
 # veriyi ayir
 X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
+weights = None
+if args.dedup:
+    # tekrar eden (ozellik, etiket) satirlarini tek satir + agirlik yap
+    rows = len(y_train)
+    X_train, y_train, weights = deduplicate(X_train, y_train)
+    print(f"Deduplicated {rows} training rows to {len(y_train)} unique rows")
+
 # modeli egit
 model = RandomForestClassifier(n_estimators=100, random_state=42)
-model.fit(X_train, y_train)
+start = time.perf_counter()
+model.fit(X_train, y_train, sample_weight=weights)
+training_time = time.perf_counter() - start
+print(f"Training time: {training_time:.1f}s")
 
 # kaydet
-joblib.dump(model, "minesweeper_model.pkl")
+joblib.dump(model, model_path("rf"))
+save_metadata(model_path("rf"), training_time=round(training_time, 2), **featurizer.metadata())
+compile_forest(model).save(model_path("rf-compiled"))  # dizi tabanli degerlendirici icin
 
 print(f"Model accuracy: {model.score(X_test, y_test)}")
@@ -0,0 +1,70 @@
+import argparse
+import os
+import time
+import warnings
+
+import numpy as np
+
+from minesweeper.datastore import DatasetReader, data_path
+from minesweeper.lockstep import simulate
+from minesweeper.metadata import load_metadata
+from minesweeper.registry import MODELS, get_policy, model_path
+
+
+def model_size(name):
+    # sinir agi icin scaler da modelin parcasi
+    path = model_path(name)
+    size = os.path.getsize(path)
+    if MODELS[name][2] == "keras.models":
+        size += os.path.getsize(os.path.join(os.path.dirname(path), "scaler.pkl"))
+    return size
+
+
+def batch_latency(policy, features, repeats=100):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        policy.predict_safe(features)
+    return (time.perf_counter() - start) / repeats
+
+
+def benchmark(name, games=10000, batch=16, seed=0):
+    start = time.perf_counter()
+    policy = get_policy(name)
+    load_time = time.perf_counter() - start
+
+    featurizer = policy.featurizer
+    X, _ = DatasetReader(data_path(featurizer.radius, featurizer.layout)).load()
+    stats = simulate(policy, games, seed=seed)
+    return {
+        "model": name,
+        "training_time": load_metadata(model_path(name)).get("training_time"),
+        "size": model_size(name),
+        "load": load_time,
+        "latency": batch_latency(policy, np.asarray(X[:batch])),
+        "win_percentage": stats["wins"] / stats["games"] * 100,
+        "safe_move_percentage": stats["safe_moves"] / stats["total_moves"] * 100,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Model ailelerini boyut, gecikme ve kazanma oraniyla karsilastir")
+    parser.add_argument("models", nargs="*", default=["knn", "svm", "rf", "nn", "gb"],
+                        help=f"registry model adlari: {', '.join(MODELS)}")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--batch", type=int, default=16, help="gecikme olcumu icin satir sayisi (bir hamledeki aday sayisi)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    warnings.simplefilter(action='ignore', category=UserWarning)
+
+    print(f"{'Model':<12} {'Train (s)':>9} {'Size (KB)':>10} {'Load (s)':>9} {'Batch (ms)':>11} {'Win %':>7} {'Safe %':>7}")
+    for name in args.models:
+        try:
+            result = benchmark(name, args.games, args.batch, args.seed)
+        except (ImportError, OSError) as error:
+            # kurulu olmayan cerceve ya da egitilmemis model
+            print(f"{name:<12} skipped: {error}")
+            continue
+        # egitim suresi modeltrain.py tarafindan metadata dosyasina yazilir
+        training_time = "-" if result["training_time"] is None else f"{result['training_time']:.1f}"
+        print(f"{name:<12} {training_time:>9} {result['size'] / 1024:>10.0f} {result['load']:>9.2f} {result['latency'] * 1000:>11.3f} "
+              f"{result['win_percentage']:>7.2f} {result['safe_move_percentage']:>7.2f}")
@@ -0,0 +1,181 @@
+import numpy as np
+
+from minesweeper.board import generate_boards
+from minesweeper.features import Featurizer
+
+DIRECTIONS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+class Bitboard:
+    # hucre (r, c) -> bit r * columns + c; maskeler python int ya da numpy uint dizisi olabilir
+    def __init__(self, rows, columns):
+        self.rows = rows
+        self.columns = columns
+        self.cells = rows * columns
+        self.full = (1 << self.cells) - 1
+        first_column = sum(1 << (r * columns) for r in range(rows))
+        self.not_first_column = self.full & ~first_column
+        self.not_last_column = self.full & ~(first_column << (columns - 1))
+        self.dtype = next((dtype for dtype in (np.uint8, np.uint16, np.uint32, np.uint64)
+                           if np.iinfo(dtype).bits >= self.cells), object)
+
+    def bit(self, r, c):
+        return 1 << (r * self.columns + c)
+
+    def shift(self, mask, dr, dc):
+        # maskeyi (dr, dc) yonunde kaydir, tahtadan tasan bitleri at
+        offset = dr * self.columns + dc
+        if offset > 0:
+            mask = (mask << offset) & self.full
+        elif offset < 0:
+            mask = mask >> -offset
+        if dc > 0:
+            mask = mask & self.not_first_column
+        elif dc < 0:
+            mask = mask & self.not_last_column
+        return mask
+
+    def neighbors(self, mask):
+        out = mask & 0
+        for dr, dc in DIRECTIONS:
+            out = out | self.shift(mask, dr, dc)
+        return out
+
+    def count_planes(self, mines):
+        # komsu mayin sayisi 4 bitlik dilimler halinde (bit-sliced toplama)
+        planes = [mines & 0] * 4
+        for dr, dc in DIRECTIONS:
+            carry = self.shift(mines, dr, dc)
+            for i in range(4):
+                planes[i], carry = planes[i] ^ carry, planes[i] & carry
+        return planes
+
+    def zeros(self, mines, planes):
+        return self.full & ~mines & ~(planes[0] | planes[1] | planes[2] | planes[3])
+
+    def flood(self, start, zeros, flagged=0, revealed=0):
+        # sifir bolgesini bit islemleriyle ac; flood_reveal gibi sadece yeni acilan sifirlardan yayil
+        region = start
+        frontier = start
+        closed = self.full & ~flagged & ~revealed
+        while True:
+            frontier = self.neighbors(frontier & zeros) & closed & ~region
+            if np.all(frontier == 0):
+                return region
+            region = region | frontier
+
+    def won(self, mines, revealed):
+        return (self.full & ~mines & ~revealed) == 0
+
+    def unpack(self, mask):
+        if isinstance(mask, int):
+            bits = np.unpackbits(np.frombuffer(mask.to_bytes((self.cells + 7) // 8, "little"), dtype=np.uint8),
+                                 bitorder="little")[:self.cells]
+        else:
+            mask = np.asarray(mask, dtype=np.uint64)
+            bits = (mask[..., None] >> np.arange(self.cells, dtype=np.uint64)) & np.uint64(1)
+        return bits.astype(bool).reshape(bits.shape[:-1] + (self.rows, self.columns))
+
+    def pack(self, cells):
+        cells = np.asarray(cells, dtype=bool).reshape(-1, self.cells)
+        if self.dtype is object:
+            packed = [int.from_bytes(np.packbits(row, bitorder="little").tobytes(), "little") for row in cells]
+            return packed[0] if len(packed) == 1 else packed
+        weights = np.left_shift(np.ones(self.cells, dtype=self.dtype), np.arange(self.cells, dtype=self.dtype))
+        packed = (cells * weights).sum(axis=1, dtype=self.dtype)
+        return int(packed[0]) if len(packed) == 1 else packed
+
+    def board(self, mines, planes):
+        counts = sum(self.unpack(plane).astype(np.int8) << i for i, plane in enumerate(planes))
+        return np.where(self.unpack(mines), np.int8(-1), counts).astype(np.int8)
+
+
+class BitboardEngine:
+    # MinesweeperEngine ile ayni arayuz, durum uc tamsayi maskede
+    def __init__(self, rows=4, columns=4, mines=3, seed=None, featurizer=None):
+        self.rows = rows
+        self.columns = columns
+        self.mines = mines
+        self.featurizer = featurizer or Featurizer()
+        self.bitboard = Bitboard(rows, columns)
+        self.rng = np.random.default_rng(seed)
+        self.reset()
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self.mine_bits = 0
+        self.revealed_bits = 0
+        self.flagged_bits = 0
+        self.zero_bits = 0
+        self.board = np.zeros((self.rows, self.columns), dtype=np.int8)
+        self.game_over = False
+        self.won = False
+        self.first_click = True
+
+    def state(self):
+        return self.mine_bits, self.revealed_bits, self.flagged_bits
+
+    @property
+    def revealed(self):
+        return self.bitboard.unpack(self.revealed_bits)
+
+    @property
+    def flagged(self):
+        return self.bitboard.unpack(self.flagged_bits)
+
+    @property
+    def mine_locations(self):
+        return {(int(r), int(c)) for r, c in np.argwhere(self.bitboard.unpack(self.mine_bits))}
+
+    def place_mines(self, first_click_r, first_click_c):
+        mines, _ = generate_boards(1, self.rows, self.columns, self.mines,
+                                   [first_click_r * self.columns + first_click_c], self.rng)
+        self.mine_bits = self.bitboard.pack(mines[0])
+        planes = self.bitboard.count_planes(self.mine_bits)
+        self.zero_bits = self.bitboard.zeros(self.mine_bits, planes)
+        self.board = self.bitboard.board(self.mine_bits, planes)
+
+    def reveal(self, r, c):
+        bit = self.bitboard.bit(r, c)
+        if self.game_over or (self.revealed_bits | self.flagged_bits) & bit:
+            return []
+        if self.first_click:
+            self.first_click = False
+            self.place_mines(r, c)
+
+        if self.mine_bits & bit:
+            self.revealed_bits |= bit
+            self.game_over = True
+            return [(r, c)]
+
+        region = self.bitboard.flood(bit, self.zero_bits, self.flagged_bits, self.revealed_bits)
+        opened = region & ~self.revealed_bits
+        self.revealed_bits |= region
+        self.check_win()
+        return [(int(i), int(j)) for i, j in np.argwhere(self.bitboard.unpack(opened))]
+
+    def flag(self, r, c):
+        bit = self.bitboard.bit(r, c)
+        if self.game_over or self.revealed_bits & bit:
+            return False
+        self.flagged_bits ^= bit
+        return bool(self.flagged_bits & bit)
+
+    def check_win(self):
+        if not self.bitboard.won(self.mine_bits, self.revealed_bits):
+            return False
+        self.won = True
+        self.game_over = True
+        return True
+
+    def legal_moves(self):
+        closed = self.bitboard.full & ~(self.revealed_bits | self.flagged_bits)
+        return [(int(r), int(c)) for r, c in np.argwhere(self.bitboard.unpack(closed))]
+
+    def get_features(self, r, c):
+        return self.featurizer.cell_features(self.board, r, c).tolist()
+
+    def features(self):
+        # tum hucrelerin ozellikleri, (rows * columns, n_features)
+        return self.featurizer.board_features(self.board)
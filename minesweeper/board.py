@@ -0,0 +1,81 @@
+from collections import deque
+
+import numpy as np
+
+
+def neighbor_sum(values):
+    # her hucrenin 8 komsusunun toplami; tek tahta ya da yigin (..., rows, columns)
+    values = np.asarray(values)
+    rows, columns = values.shape[-2:]
+    padded = np.pad(values.astype(np.int8), [(0, 0)] * (values.ndim - 2) + [(1, 1), (1, 1)])
+    total = np.zeros(values.shape, dtype=np.int8)
+    for i in range(3):
+        for j in range(3):
+            if (i, j) != (1, 1):
+                total += padded[..., i:i + rows, j:j + columns]
+    return total
+
+
+def neighbor_counts(mines):
+    # tek tahta (rows, columns) ya da tahta yigini (..., rows, columns)
+    mines = np.asarray(mines, dtype=bool)
+    return np.where(mines, np.int8(-1), neighbor_sum(mines))
+
+
+def generate_boards(count, rows, columns, mines, first_clicks=None, rng=None):
+    # reddetme dongusu olmadan: her tahtaya rastgele anahtar ver, en kucuk `mines` tanesi mayin
+    rng = np.random.default_rng(rng)
+    cells = rows * columns
+    if not 0 <= mines < cells:
+        raise ValueError(f"mines must be between 0 and {cells - 1}, got {mines}")
+    keys = rng.random((count, cells))
+    if first_clicks is not None:
+        keys[np.arange(count), first_clicks] = np.inf
+    chosen = np.argpartition(keys, mines, axis=1)[:, :mines]
+    mine_mask = np.zeros((count, cells), dtype=bool)
+    np.put_along_axis(mine_mask, chosen, True, axis=1)
+    mine_mask = mine_mask.reshape(count, rows, columns)
+    return mine_mask, neighbor_counts(mine_mask)
+
+def dilate(mask):
+    # 3x3 komsulugu isaretle
+    mask = np.asarray(mask, dtype=bool)
+    rows, columns = mask.shape[-2:]
+    padded = np.pad(mask, [(0, 0)] * (mask.ndim - 2) + [(1, 1), (1, 1)])
+    out = np.zeros_like(mask)
+    for i in range(3):
+        for j in range(3):
+            out |= padded[..., i:i + rows, j:j + columns]
+    return out
+
+
+def flood_reveal(board, revealed, r, c, flagged=None):
+    # sifir bolgesini kuyrukla ac, acilan hucreleri dondur
+    rows, columns = board.shape
+    opened = [(r, c)]
+    revealed[r, c] = True
+    queue = deque(opened)
+    while queue:
+        r, c = queue.popleft()
+        if board[r, c] != 0:
+            continue
+        for i in range(max(0, r - 1), min(rows, r + 2)):
+            for j in range(max(0, c - 1), min(columns, c + 2)):
+                if revealed[i, j] or (flagged is not None and flagged[i, j]):
+                    continue
+                revealed[i, j] = True
+                opened.append((i, j))
+                queue.append((i, j))
+    return opened
+
+
+def flood_reveal_batch(board, revealed, flagged=None):
+    # tahta yigininda acik sifirlarin komsularini bolge kapanana kadar ac
+    revealed = revealed.copy()
+    closed = ~revealed if flagged is None else ~revealed & ~flagged
+    while True:
+        spread = dilate(revealed & (board == 0)) & closed
+        if not spread.any():
+            return revealed
+        revealed |= spread
+        closed &= ~spread
@@ -0,0 +1,44 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from minesweeper.policy import ModelPolicy
+
+
+class CachedPolicy(ModelPolicy):
+    # modelin onunde sinirli LRU onbellek; anahtar ozellik satirinin baytlari (int8 demeti)
+    def __init__(self, policy, maxsize=100000):
+        super().__init__(policy.model, policy.featurizer)
+        self.policy = policy
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def predict_safe(self, features):
+        features = np.ascontiguousarray(features, dtype=np.int8)
+        scores = np.empty(len(features))
+        missing = {}
+        for i, row in enumerate(features):
+            key = row.tobytes()
+            score = self.cache.get(key)
+            if score is None:
+                missing.setdefault(key, []).append(i)
+            else:
+                self.cache.move_to_end(key)
+                scores[i] = score
+        self.hits += len(features) - sum(len(rows) for rows in missing.values())
+        if not missing:
+            return scores
+
+        # bulunamayan satirlar tek cagrida modele sorulur
+        self.misses += sum(len(rows) for rows in missing.values())
+        predicted = self.policy.predict_safe(features[[rows[0] for rows in missing.values()]])
+        for (key, rows), score in zip(missing.items(), predicted):
+            scores[rows] = score
+            self.cache[key] = float(score)
+        while len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+            self.evictions += 1
+        return scores
@@ -0,0 +1,89 @@
+import argparse
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import joblib
+import numpy as np
+
+from minesweeper.datastore import DatasetWriter, data_path
+from minesweeper.features import Featurizer
+from minesweeper.lockstep import LockstepSimulator
+from minesweeper.metadata import load_metadata
+from minesweeper.policy import ModelPolicy, RandomPolicy, RuleBasedPolicy
+from minesweeper.registry import MODELS, get_policy
+
+
+def load_model_policy(model_path):
+    warnings.simplefilter(action='ignore', category=UserWarning)
+    if model_path in MODELS:
+        return get_policy(model_path)
+    featurizer = Featurizer.from_metadata(load_metadata(model_path))
+    return ModelPolicy(joblib.load(model_path), featurizer)
+
+
+def play_and_log(policy, featurizer, games, rows=4, columns=4, mines=3, seed=None):
+    # dataget.py gibi: acilan her hucre icin ozellikler + etiket (1 = guvenli)
+    simulator = LockstepSimulator(games, rows, columns, mines, seed=seed)
+    features = []
+    labels = []
+    while simulator.step(policy):
+        opened = simulator.opened
+        features.append(featurizer.candidate_features(simulator.board, opened.reshape(games, -1)))
+        labels.append((simulator.board[opened] != -1).astype(np.int8))
+    return np.concatenate(features).astype(np.int8), np.concatenate(labels)
+
+
+def _generate_shard(load_policy, featurizer, games, rows, columns, mines, seed, batch_size):
+    policy = load_policy()
+    rng = np.random.default_rng(seed)
+    shards = [play_and_log(policy, featurizer, min(batch_size, games - offset), rows, columns, mines, rng)
+              for offset in range(0, games, batch_size)]
+    return np.concatenate([X for X, _ in shards]), np.concatenate([y for _, y in shards])
+
+
+def generate(load_policy, games, featurizer=None, rows=4, columns=4, mines=3, seed=None, workers=None,
+             shard_size=10000, batch_size=4096):
+    # parcalar isci sayisindan bagimsiz tohumlanir, ayni seed -> ayni veri
+    featurizer = featurizer or Featurizer()
+    shards = [min(shard_size, games - offset) for offset in range(0, games, shard_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(shards))
+    with ProcessPoolExecutor(workers) as executor:
+        results = list(executor.map(_generate_shard, [load_policy] * len(shards), [featurizer] * len(shards),
+                                    shards, [rows] * len(shards), [columns] * len(shards),
+                                    [mines] * len(shards), seeds, [batch_size] * len(shards)))
+    return np.concatenate([X for X, _ in results]), np.concatenate([y for _, y in results])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Arayuz olmadan etiketli veri uret")
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--policy", default="random", choices=["random", "rules", "model"])
+    parser.add_argument("--model", help="--policy model icin model adi (knn, svm, rf, nn) ya da model dosyasi (.pkl)")
+    parser.add_argument("--rows", type=int, default=4)
+    parser.add_argument("--columns", type=int, default=4)
+    parser.add_argument("--mines", type=int, default=3)
+    parser.add_argument("--radius", type=int, default=1)
+    parser.add_argument("--layout", default="legacy", choices=["legacy", "padded"])
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--out", help="veri deposu klasoru (varsayilan: data/ altindaki ortak depo)")
+    args = parser.parse_args()
+
+    if args.policy == "model":
+        if not args.model:
+            parser.error("--policy model requires --model")
+        load_policy = partial(load_model_policy, args.model)
+    else:
+        load_policy = RandomPolicy if args.policy == "random" else RuleBasedPolicy
+    featurizer = Featurizer(args.radius, args.layout)
+
+    start = time.perf_counter()
+    features, labels = generate(load_policy, args.games, featurizer, args.rows, args.columns, args.mines,
+                                seed=args.seed, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    out = args.out or data_path(args.radius, args.layout)
+    DatasetWriter(out, featurizer.n_features, radius=args.radius, layout=args.layout).append(features, labels)
+    print(f"Rows: {len(labels)} ({labels.mean() * 100:.2f}% safe) -> {out}")
+    print(f"Rows per minute: {len(labels) / elapsed * 60:.0f}")
@@ -0,0 +1,157 @@
+import argparse
+import json
+import os
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CHUNK_ROWS = 1 << 20
+
+# Depo bir klasordur:
+#   meta.json                 -> n_features, satir sayilari, featurizer bilgisi
+#   chunk_00000.features.npy  -> (rows, n_features) int8, sutun sirali (Fortran)
+#   chunk_00000.labels.npy    -> (rows,) int8, 1 = guvenli
+# Her ekleme yeni parca yazar; kucuk parcalar `compact` ile birlestirilir.
+
+
+def data_path(radius=1, layout="legacy"):
+    # tum model klasorlerinin paylastigi depo
+    name = "minesweeper_data" if (radius, layout) == (1, "legacy") else f"minesweeper_data_r{radius}_{layout}"
+    return os.path.join(ROOT, "data", name)
+
+
+def _read_meta(path):
+    with open(os.path.join(path, "meta.json")) as file:
+        return json.load(file)
+
+
+def _write_meta(path, meta):
+    tmp = os.path.join(path, "meta.json.tmp")
+    with open(tmp, "w") as file:
+        json.dump(meta, file, indent=2)
+    os.replace(tmp, os.path.join(path, "meta.json"))
+
+
+class DatasetWriter:
+    def __init__(self, path, n_features, chunk_rows=CHUNK_ROWS, **metadata):
+        self.path = path
+        self.chunk_rows = chunk_rows
+        if os.path.exists(os.path.join(path, "meta.json")):
+            self.meta = _read_meta(path)
+            if self.meta["n_features"] != n_features:
+                raise ValueError(f"{path} stores {self.meta['n_features']} features, got {n_features}")
+            # ayni sayida ozellik farkli sirada olabilir (radius 1 legacy / padded)
+            for key, value in metadata.items():
+                if self.meta.get(key) != value:
+                    raise ValueError(f"{path} stores {key}={self.meta.get(key)!r}, got {value!r}")
+        else:
+            os.makedirs(path, exist_ok=True)
+            self.meta = dict(metadata, n_features=n_features, chunks=[])
+            _write_meta(path, self.meta)
+
+    def _save_chunk(self, features, labels):
+        # parca adlari hic tekrar kullanilmaz, birlestirme eski dosyalari meta.json'dan sonra siler
+        index = self.meta.get("next_chunk", len(self.meta["chunks"]))
+        self.meta["next_chunk"] = index + 1
+        name = f"chunk_{index:05d}"
+        np.save(os.path.join(self.path, name + ".features.npy"), np.asfortranarray(features, dtype=np.int8))
+        np.save(os.path.join(self.path, name + ".labels.npy"), np.asarray(labels, dtype=np.int8))
+        return {"name": name, "rows": len(labels)}
+
+    def append(self, features, labels):
+        features = np.asarray(features, dtype=np.int8).reshape(-1, self.meta["n_features"])
+        labels = np.asarray(labels, dtype=np.int8).reshape(-1)
+        if len(features) != len(labels):
+            raise ValueError(f"got {len(features)} feature rows but {len(labels)} labels")
+
+        # eski parcalara dokunulmaz, her ekleme yeni parca yazar; veri once, meta.json en son
+        chunks = self.meta["chunks"]
+        for start in range(0, len(labels), self.chunk_rows):
+            chunks.append(self._save_chunk(features[start:start + self.chunk_rows], labels[start:start + self.chunk_rows]))
+        _write_meta(self.path, self.meta)
+
+    def compact(self):
+        # kucuk parcalari chunk_rows boyutunda parcalarda birlestir
+        old = self.meta["chunks"]
+        if sum(chunk["rows"] < self.chunk_rows for chunk in old) < 2:
+            return 0
+        chunks = [chunk for chunk in old if chunk["rows"] >= self.chunk_rows]
+        small = [_load_chunk(self.path, chunk["name"]) for chunk in old if chunk["rows"] < self.chunk_rows]
+        features = np.concatenate([X for X, _ in small])
+        labels = np.concatenate([y for _, y in small])
+        for start in range(0, len(labels), self.chunk_rows):
+            chunks.append(self._save_chunk(features[start:start + self.chunk_rows], labels[start:start + self.chunk_rows]))
+        self.meta["chunks"] = chunks
+        _write_meta(self.path, self.meta)
+
+        # yeni meta.json yazildiktan sonra artik kimse eski parcalari okumaz
+        kept = {chunk["name"] for chunk in chunks}
+        for chunk in old:
+            if chunk["name"] not in kept:
+                for suffix in (".features.npy", ".labels.npy"):
+                    os.remove(os.path.join(self.path, chunk["name"] + suffix))
+        return len(old) - len(chunks)
+
+
+def _load_chunk(path, name, mmap_mode="r"):
+    features = np.load(os.path.join(path, name + ".features.npy"), mmap_mode=mmap_mode)
+    labels = np.load(os.path.join(path, name + ".labels.npy"), mmap_mode=mmap_mode)
+    return features, labels
+
+
+class DatasetReader:
+    def __init__(self, path):
+        self.path = path
+        self.meta = _read_meta(path)
+        self.n_features = self.meta["n_features"]
+        self.n_rows = sum(chunk["rows"] for chunk in self.meta["chunks"])
+
+    def chunks(self):
+        # her parca kopyasiz bellek eslemeli (memmap) dizi olarak doner
+        for chunk in self.meta["chunks"]:
+            yield _load_chunk(self.path, chunk["name"])
+
+    def load(self):
+        chunks = list(self.chunks())
+        if not chunks:
+            return np.empty((0, self.n_features), dtype=np.int8), np.empty(0, dtype=np.int8)
+        if len(chunks) == 1:
+            return chunks[0]
+        return np.concatenate([X for X, _ in chunks]), np.concatenate([y for _, y in chunks])
+
+
+def import_csv(csv_path, path, **metadata):
+    # eski basliksiz minesweeper_data.csv dosyalarini depoya aktar
+    rows = np.loadtxt(csv_path, delimiter=",", dtype=np.int8, ndmin=2)
+    writer = DatasetWriter(path, rows.shape[1] - 1, **metadata)
+    writer.append(rows[:, :-1], rows[:, -1])
+    return len(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ikili veri deposu araclari")
+    commands = parser.add_subparsers(dest="command", required=True)
+    importer = commands.add_parser("import", help="CSV dosyasini depoya ekle")
+    importer.add_argument("csv")
+    importer.add_argument("--out")
+    importer.add_argument("--radius", type=int, default=1)
+    importer.add_argument("--layout", default="legacy", choices=["legacy", "padded"])
+    info = commands.add_parser("info")
+    info.add_argument("path", nargs="?", default=data_path())
+    compact = commands.add_parser("compact", help="kucuk parcalari birlestir")
+    compact.add_argument("path", nargs="?", default=data_path())
+    args = parser.parse_args()
+
+    if args.command == "import":
+        out = args.out or data_path(args.radius, args.layout)
+        rows = import_csv(args.csv, out, radius=args.radius, layout=args.layout)
+        print(f"Imported {rows} rows into {out}")
+    elif args.command == "compact":
+        reader = DatasetReader(args.path)
+        merged = DatasetWriter(args.path, reader.n_features).compact()
+        print(f"{args.path}: merged away {merged} chunks")
+    else:
+        reader = DatasetReader(args.path)
+        _, labels = reader.load()
+        print(f"{args.path}: {reader.n_rows} rows, {reader.n_features} features, "
+              f"{len(reader.meta['chunks'])} chunks, {labels.mean() * 100:.2f}% safe")
@@ -0,0 +1,14 @@
+import numpy as np
+
+
+def _row_keys(rows):
+    # her satiri tek bir bayt dizisi olarak gor, np.unique satirlari hizli karsilastirsin
+    rows = np.ascontiguousarray(rows, dtype=np.int8)
+    return rows.view(np.dtype((np.void, rows.shape[1]))).reshape(-1)
+
+
+def deduplicate(features, labels):
+    # benzersiz (ozellik, etiket) satirlari ve tekrar sayilari -> sample_weight olarak kullanilir
+    rows = np.column_stack([np.asarray(features, dtype=np.int8), np.asarray(labels, dtype=np.int8)])
+    _, index, counts = np.unique(_row_keys(rows), return_index=True, return_counts=True)
+    return rows[index, :-1], rows[index, -1], counts
@@ -0,0 +1,75 @@
+import numpy as np
+
+from minesweeper.board import flood_reveal, generate_boards, neighbor_counts
+from minesweeper.features import Featurizer
+
+
+class MinesweeperEngine:
+    def __init__(self, rows=4, columns=4, mines=3, seed=None, featurizer=None):
+        self.rows = rows
+        self.columns = columns
+        self.mines = mines
+        self.featurizer = featurizer or Featurizer()
+        self.rng = np.random.default_rng(seed)
+        self.reset()
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self.board = np.zeros((self.rows, self.columns), dtype=np.int8)
+        self.revealed = np.zeros((self.rows, self.columns), dtype=bool)
+        self.flagged = np.zeros((self.rows, self.columns), dtype=bool)
+        self.mine_locations = set()
+        self.game_over = False
+        self.won = False
+        self.first_click = True
+
+    def place_mines(self, first_click_r, first_click_c):
+        # ilk tiklanan hucre haric mayin yerlestir
+        mines, boards = generate_boards(1, self.rows, self.columns, self.mines,
+                                        [first_click_r * self.columns + first_click_c], self.rng)
+        self.board = boards[0]
+        self.mine_locations = {(int(r), int(c)) for r, c in np.argwhere(mines[0])}
+
+    def update_counts(self):
+        self.board = neighbor_counts(self.board == -1)
+
+    def reveal(self, r, c):
+        # acilan hucrelerin listesini dondurur, gecersiz hamlede bos liste
+        if self.game_over or self.revealed[r, c] or self.flagged[r, c]:
+            return []
+        if self.first_click:
+            self.first_click = False
+            self.place_mines(r, c)
+
+        if self.board[r, c] == -1:
+            self.revealed[r, c] = True
+            self.game_over = True
+            return [(r, c)]
+
+        opened = flood_reveal(self.board, self.revealed, r, c, self.flagged)
+        self.check_win()
+        return opened
+
+    def flag(self, r, c):
+        if self.game_over or self.revealed[r, c]:
+            return False
+        self.flagged[r, c] = not self.flagged[r, c]
+        return bool(self.flagged[r, c])
+
+    def check_win(self):
+        if np.any(~self.revealed & (self.board != -1)):
+            return False
+        self.won = True
+        self.game_over = True
+        return True
+
+    def legal_moves(self):
+        return [(int(r), int(c)) for r, c in np.argwhere(~self.revealed & ~self.flagged)]
+
+    def get_features(self, r, c):
+        return self.featurizer.cell_features(self.board, r, c).tolist()
+
+    def features(self):
+        # tum hucrelerin ozellikleri, (rows * columns, n_features)
+        return self.featurizer.board_features(self.board)
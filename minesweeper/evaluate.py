@@ -0,0 +1,46 @@
+import time
+
+
+def play_games(engine, policy, games, seed=None):
+    # arayuz olmadan, beklemeden oyun oynat
+    wins = 0
+    total_moves = 0
+    safe_moves = 0
+    start = time.perf_counter()
+    for game in range(games):
+        engine.reset(seed if game == 0 else None)
+        while not engine.game_over:
+            move = policy.best_move(engine)
+            if move is None:
+                break
+            opened = engine.reveal(*move)
+            total_moves += len(opened)
+            safe_moves += len(opened)
+            if engine.game_over and not engine.won:
+                safe_moves -= 1  # son acilan hucre mayin
+        if engine.won:
+            wins += 1
+    return {
+        "games": games,
+        "wins": wins,
+        "total_moves": total_moves,
+        "safe_moves": safe_moves,
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+def print_statistics(stats):
+    win_percentage = (stats["wins"] / stats["games"]) * 100
+    safe_move_percentage = (stats["safe_moves"] / stats["total_moves"]) * 100
+    print(f"Games played: {stats['games']}")
+    print(f"Games won: {stats['wins']}")
+    print(f"Win percentage: {win_percentage:.2f}%")
+    print(f"Safe move percentage: {safe_move_percentage:.2f}%")
+    print(f"Games per second: {stats['games'] / stats['elapsed']:.1f}")
+
+
+def print_cache_statistics(policy):
+    lookups = policy.hits + policy.misses
+    hit_percentage = (policy.hits / lookups) * 100 if lookups else 0.0
+    print(f"Cache hits: {policy.hits} / {lookups} ({hit_percentage:.2f}%)")
+    print(f"Cache size: {len(policy.cache)} / {policy.maxsize}, evictions: {policy.evictions}")
@@ -0,0 +1,91 @@
+from functools import lru_cache
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+SENTINEL = -1
+LAYOUTS = ("legacy", "padded")
+
+
+def feature_count(radius=1):
+    return (2 * radius + 1) ** 2 - 1
+
+
+@lru_cache(maxsize=None)
+def neighbor_table(rows, columns, radius=1, layout="legacy"):
+    # her hucre icin dolgulu tahtadaki komsu indeksleri, (rows * columns, feature_count(radius))
+    # legacy: get_features sirasi (sinir icindeki komsular, sonra dolgu)
+    # padded: sabit konumlar, tahta disi komsular dolgu
+    if layout not in LAYOUTS:
+        raise ValueError(f"layout must be one of {LAYOUTS}, got {layout!r}")
+    if radius < 1:
+        raise ValueError(f"radius must be at least 1, got {radius}")
+    width = columns + 2 * radius
+    table = np.zeros((rows * columns, feature_count(radius)), dtype=np.intp)  # 0 = dolgulu tahtanin kosesi
+    for r in range(rows):
+        for c in range(columns):
+            neighbors = [(i + radius) * width + (j + radius)
+                         for i in range(r - radius, r + radius + 1)
+                         for j in range(c - radius, c + radius + 1)
+                         if (i, j) != (r, c) and (layout == "padded" or (0 <= i < rows and 0 <= j < columns))]
+            table[r * columns + c, :len(neighbors)] = neighbors
+    table.setflags(write=False)
+    return table
+
+
+def pad_board(board, radius=1):
+    board = np.asarray(board)
+    return np.pad(board, [(0, 0)] * (board.ndim - 2) + [(radius, radius), (radius, radius)],
+                  constant_values=SENTINEL)
+
+
+def board_features(board, radius=1, layout="legacy"):
+    # tek tahta (rows, columns) -> (rows * columns, n); yigin (k, rows, columns) -> (k, rows * columns, n)
+    board = np.asarray(board)
+    rows, columns = board.shape[-2:]
+    padded = pad_board(board, radius)
+    if layout == "padded":
+        size = 2 * radius + 1
+        windows = sliding_window_view(padded, (size, size), axis=(-2, -1))
+        windows = windows.reshape(board.shape[:-2] + (rows * columns, size * size))
+        center = size * size // 2
+        return windows[..., [i for i in range(size * size) if i != center]]
+    flat = padded.reshape(board.shape[:-2] + (-1,))
+    return flat[..., neighbor_table(rows, columns, radius, layout)]
+
+
+def cell_features(board, r, c, radius=1, layout="legacy"):
+    board = np.asarray(board)
+    rows, columns = board.shape
+    return pad_board(board, radius).reshape(-1)[neighbor_table(rows, columns, radius, layout)[r * columns + c]]
+
+
+def candidate_features(board, candidates, radius=1, layout="legacy"):
+    # sadece aday hucrelerin ozellikleri, satir sirasiyla
+    features = board_features(board, radius, layout)
+    return features[np.asarray(candidates).reshape(features.shape[:-1])]
+
+
+class Featurizer:
+    def __init__(self, radius=1, layout="legacy"):
+        if layout not in LAYOUTS:
+            raise ValueError(f"layout must be one of {LAYOUTS}, got {layout!r}")
+        self.radius = radius
+        self.layout = layout
+        self.n_features = feature_count(radius)
+
+    @classmethod
+    def from_metadata(cls, metadata):
+        return cls(metadata.get("radius", 1), metadata.get("layout", "legacy"))
+
+    def metadata(self):
+        return {"radius": self.radius, "layout": self.layout, "n_features": self.n_features}
+
+    def board_features(self, board):
+        return board_features(board, self.radius, self.layout)
+
+    def cell_features(self, board, r, c):
+        return cell_features(board, r, c, self.radius, self.layout)
+
+    def candidate_features(self, board, candidates):
+        return candidate_features(board, candidates, self.radius, self.layout)
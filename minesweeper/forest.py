@@ -0,0 +1,121 @@
+import argparse
+import time
+
+import numpy as np
+
+UNIQUE_ROWS = 256
+
+
+def compile_forest(model):
+    # tum agaclarin dugumleri ardisik dizilerde; yapraklar kendilerine baglanir (cocuk = kendisi)
+    features, thresholds, children, values, roots = [], [], [], [], []
+    offset = 0
+    depth = 0
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        if tree.n_outputs != 1:
+            raise ValueError(f"only single-output forests can be compiled, got {tree.n_outputs} outputs")
+        leaf = tree.children_left == -1
+        nodes = np.arange(tree.node_count) + offset
+        features.append(np.where(leaf, 0, tree.feature))
+        thresholds.append(tree.threshold)
+        children.append(np.column_stack([np.where(leaf, nodes, tree.children_left + offset),
+                                         np.where(leaf, nodes, tree.children_right + offset)]))
+
+        value = tree.value[:, 0, :model.n_classes_]
+        # eski scikit-learn surumleri yapraklarda sayi saklar ve predict_proba'da normalize eder
+        total = value.sum(axis=1, keepdims=True)
+        if not np.allclose(total, 1):
+            value = value / np.where(total == 0, 1, total)
+        values.append(value)
+
+        roots.append(offset)
+        offset += tree.node_count
+        depth = max(depth, tree.max_depth)
+    return CompiledForest(np.concatenate(features).astype(np.intp), np.concatenate(thresholds),
+                          np.concatenate(children).astype(np.intp), np.concatenate(values),
+                          np.array(roots, dtype=np.intp), depth)
+
+
+class CompiledForest:
+    # RandomForestClassifier.predict_proba ile ayni sonuc, butun agaclar ayni anda dizi islemleriyle
+    def __init__(self, features, thresholds, children, values, roots, depth):
+        self.features = features
+        self.thresholds = thresholds
+        self.children = children
+        self.values = values
+        self.roots = roots
+        self.depth = int(depth)
+
+    def save(self, path):
+        np.savez(path, features=self.features, thresholds=self.thresholds, children=self.children,
+                 values=self.values, roots=self.roots, depth=self.depth)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as arrays:
+            return cls(arrays["features"], arrays["thresholds"], arrays["children"], arrays["values"],
+                       arrays["roots"], arrays["depth"])
+
+    def apply(self, features):
+        # her satir ve agac icin varilan yaprak, (rows, trees)
+        X = np.asarray(features, dtype=np.float32)  # scikit-learn de float32 ile karsilastirir
+        rows = np.arange(len(X))[:, None]
+        node = np.broadcast_to(self.roots, (len(X), len(self.roots)))
+        for _ in range(self.depth):
+            right = X[rows, self.features[node]] > self.thresholds[node]
+            node = self.children[node, right.astype(np.intp)]
+        return node
+
+    def predict_proba(self, features):
+        features = np.asarray(features)
+        if len(features) > UNIQUE_ROWS:
+            # buyuk yiginlarda ayni ozellik satirlari cok tekrar eder, her biri bir kez skorlanir
+            unique, inverse = np.unique(features, axis=0, return_inverse=True)
+            return self._predict_proba(unique)[inverse.reshape(-1)]
+        return self._predict_proba(features)
+
+    def _predict_proba(self, features):
+        leaves = self.apply(features)
+        # agac sirasiyla topla, sonra bol (scikit-learn ile bit bit ayni)
+        proba = np.zeros((len(leaves), self.values.shape[1]))
+        for tree in range(len(self.roots)):
+            proba += self.values[leaves[:, tree]]
+        proba /= len(self.roots)
+        return proba
+
+
+if __name__ == "__main__":
+    import warnings
+
+    import joblib
+
+    from minesweeper.datastore import DatasetReader, data_path
+    from minesweeper.metadata import load_metadata
+    from minesweeper.registry import model_path
+
+    parser = argparse.ArgumentParser(description="Random Forest modelini dizi tabanli degerlendiriciye derle")
+    parser.add_argument("--rows", type=int, default=10000, help="karsilastirma icin kullanilacak satir sayisi")
+    parser.add_argument("--batch", type=int, default=16, help="hiz olcumu icin satir sayisi (bir hamledeki aday sayisi)")
+    args = parser.parse_args()
+    warnings.simplefilter(action='ignore', category=UserWarning)
+
+    source = model_path("rf")
+    model = joblib.load(source)
+    forest = compile_forest(model)
+    out = model_path("rf-compiled")
+    forest.save(out)
+
+    meta = load_metadata(source)
+    X, _ = DatasetReader(data_path(meta["radius"], meta["layout"])).load()
+    X = np.asarray(X[:args.rows])
+    print(f"Saved {out}")
+    difference = np.abs(forest.predict_proba(X) - model.predict_proba(X)).max()
+    print(f"Max difference from scikit-learn on {len(X)} rows: {difference:.2e}")
+
+    batch = X[:args.batch]
+    for name, predict in (("scikit-learn", model.predict_proba), ("compiled", forest.predict_proba)):
+        start = time.perf_counter()
+        for _ in range(100):
+            predict(batch)
+        print(f"{name}: {(time.perf_counter() - start) * 10:.3f} ms per {len(batch)}-row batch")
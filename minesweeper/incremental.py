@@ -0,0 +1,71 @@
+import numpy as np
+from sklearn.linear_model import SGDClassifier
+from sklearn.naive_bayes import CategoricalNB
+from sklearn.neural_network import MLPClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import FunctionTransformer, StandardScaler
+
+LEARNERS = ("sgd", "nb", "mlp")
+CHUNK_ROWS = 1 << 16
+CLASSES = np.array([0, 1])
+
+
+def shift_categories(features):
+    # -1 .. 8 -> 0 .. 9, CategoricalNB negatif kategori almaz
+    return np.asarray(features, dtype=np.int16) + 1
+
+
+def stream(reader, chunk_rows=CHUNK_ROWS, test_size=0.2, seed=42):
+    # depoyu sabit boyutlu parcalar halinde oku; ayni seed -> her geciste ayni egitim/test ayrimi
+    rng = np.random.default_rng(seed)
+    for features, labels in reader.chunks():
+        for start in range(0, len(labels), chunk_rows):
+            X = np.asarray(features[start:start + chunk_rows])
+            y = np.asarray(labels[start:start + chunk_rows])
+            test = rng.random(len(y)) < test_size
+            yield X[~test], y[~test], X[test], y[test]
+
+
+def train_incremental(reader, learner="sgd", epochs=5, chunk_rows=CHUNK_ROWS, seed=42):
+    # bellekte ayni anda en fazla bir parca bulunur
+    if learner not in LEARNERS:
+        raise ValueError(f"learner must be one of {LEARNERS}, got {learner!r}")
+
+    rows = 0
+    if learner == "nb":
+        # sayim tabanli, tek gecis yeterli
+        model = CategoricalNB(min_categories=10)
+        for X_train, y_train, _, _ in stream(reader, chunk_rows, seed=seed):
+            if len(y_train):
+                model.partial_fit(shift_categories(X_train), y_train, classes=CLASSES)
+                rows += len(y_train)
+        if not rows:
+            raise ValueError(f"{reader.path} has no training rows")
+        # durumsuz donusum, fit gerekmez
+        pipeline = Pipeline([("shift", FunctionTransformer(shift_categories)), ("model", model)])
+    else:
+        # ilk gecis sadece olcekleyici icin
+        scaler = StandardScaler()
+        for X_train, _, _, _ in stream(reader, chunk_rows, seed=seed):
+            if len(X_train):
+                scaler.partial_fit(X_train)
+                rows += len(X_train)
+        if not rows:
+            raise ValueError(f"{reader.path} has no training rows")
+        if learner == "sgd":
+            model = SGDClassifier(loss="log_loss", random_state=seed)
+        else:
+            model = MLPClassifier(hidden_layer_sizes=(64, 32), random_state=seed)
+        for _ in range(epochs):
+            for X_train, y_train, _, _ in stream(reader, chunk_rows, seed=seed):
+                if len(y_train):
+                    model.partial_fit(scaler.transform(X_train), y_train, classes=CLASSES)
+        pipeline = Pipeline([("scaler", scaler), ("model", model)])
+
+    correct = 0
+    total = 0
+    for _, _, X_test, y_test in stream(reader, chunk_rows, seed=seed):
+        if len(y_test):
+            correct += int(np.count_nonzero(pipeline.predict(X_test) == y_test))
+            total += len(y_test)
+    return pipeline, correct / total if total else 0.0
@@ -0,0 +1,77 @@
+import argparse
+import time
+
+import numpy as np
+
+
+class HashedKNN:
+    # egitim satirlariyla birebir ayni sorgular sozlukten cevaplanir, gorulmemis satirlar modele gider
+    def __init__(self, model):
+        self.model = model
+        X = np.asarray(model._fit_X)
+        rows = X.astype(np.int8)
+        if not np.array_equal(rows, X):
+            raise ValueError("training rows must be small integer feature vectors")
+        if np.ndim(model._y) != 1:
+            raise ValueError("only single-output KNeighborsClassifier models are supported")
+
+        unique, inverse = np.unique(rows, axis=0, return_inverse=True)
+        counts = np.zeros((len(unique), len(model.classes_)), dtype=np.int64)
+        np.add.at(counts, (inverse.reshape(-1), model._y), 1)
+
+        # en az k kopyasi olan ve tek etiketli satirin k komsusu da kendi kopyalari: olasilik 1
+        totals = counts.sum(axis=1)
+        pure = (counts.max(axis=1) == totals) & (totals >= model.n_neighbors)
+        self.proba = np.zeros(counts.shape)
+        self.proba[pure, counts[pure].argmax(axis=1)] = 1.0
+        # karisik ya da az kopyali satirlarda esitlik kirma scikit-learn'e ait, bir kez ona sorulur
+        if not pure.all():
+            self.proba[~pure] = model.predict_proba(unique[~pure])
+        self.index = {row.tobytes(): i for i, row in enumerate(unique)}
+        self.from_counts = int(np.count_nonzero(pure))
+
+    def predict_proba(self, features):
+        features = np.ascontiguousarray(features, dtype=np.int8)
+        index = np.array([self.index.get(row.tobytes(), -1) for row in features], dtype=np.intp)
+        seen = index >= 0
+        proba = np.empty((len(features), self.proba.shape[1]))
+        proba[seen] = self.proba[index[seen]]
+        if not seen.all():
+            proba[~seen] = self.model.predict_proba(features[~seen])
+        return proba
+
+
+if __name__ == "__main__":
+    import warnings
+
+    import joblib
+
+    from minesweeper.datastore import DatasetReader, data_path
+    from minesweeper.metadata import load_metadata
+    from minesweeper.registry import model_path
+
+    parser = argparse.ArgumentParser(description="KNN modelini birebir eslesme tablosuyla karsilastir")
+    parser.add_argument("--rows", type=int, default=10000, help="karsilastirma icin kullanilacak satir sayisi")
+    parser.add_argument("--batch", type=int, default=16, help="hiz olcumu icin satir sayisi (bir hamledeki aday sayisi)")
+    args = parser.parse_args()
+    warnings.simplefilter(action='ignore', category=UserWarning)
+
+    source = model_path("knn")
+    model = joblib.load(source)
+    start = time.perf_counter()
+    knn = HashedKNN(model)
+    print(f"Indexed {len(knn.index)} distinct training rows ({knn.from_counts} answered from counts) "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    meta = load_metadata(source)
+    X, _ = DatasetReader(data_path(meta["radius"], meta["layout"])).load()
+    X = np.asarray(X[:args.rows])
+    difference = np.abs(knn.predict_proba(X) - model.predict_proba(X)).max()
+    print(f"Max difference from scikit-learn on {len(X)} rows: {difference:.2e}")
+
+    batch = X[:args.batch]
+    for name, predict in (("scikit-learn", model.predict_proba), ("hashed", knn.predict_proba)):
+        start = time.perf_counter()
+        for _ in range(100):
+            predict(batch)
+        print(f"{name}: {(time.perf_counter() - start) * 10:.3f} ms per {len(batch)}-row batch")
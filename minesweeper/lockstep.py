@@ -0,0 +1,97 @@
+import time
+
+import numpy as np
+
+from minesweeper.board import flood_reveal_batch, generate_boards
+
+
+class LockstepSimulator:
+    def __init__(self, games, rows=4, columns=4, mines=3, seed=None):
+        self.games = games
+        self.rows = rows
+        self.columns = columns
+        self.mines = mines
+        self.rng = np.random.default_rng(seed)
+        self.reset()
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        shape = (self.games, self.rows, self.columns)
+        self.board = np.zeros(shape, dtype=np.int8)
+        self.revealed = np.zeros(shape, dtype=bool)
+        self.first_click = np.ones(self.games, dtype=bool)
+        self.game_over = np.zeros(self.games, dtype=bool)
+        self.won = np.zeros(self.games, dtype=bool)
+        self.opened = np.zeros(shape, dtype=bool)
+        self.total_moves = 0
+        self.safe_moves = 0
+
+    def place_mines(self, games, cells):
+        # ilk tiklanan hucre haric, her oyun icin mayinlari ayni anda sec
+        _, self.board[games] = generate_boards(len(games), self.rows, self.columns, self.mines, cells, self.rng)
+
+    def step(self, policy):
+        live = ~self.game_over
+        candidates = live[:, None] & ~self.revealed.reshape(self.games, -1)
+        if not candidates.any():
+            return False
+
+        # tum oyunlarin adaylarini tek cagrida skorla
+        scores = np.full(candidates.shape, -np.inf)
+        scores[candidates] = policy.score_candidates(self, candidates)
+        games = np.flatnonzero(candidates.any(axis=1))
+        cells = np.argmax(scores[games], axis=1)
+
+        first = self.first_click[games]
+        if first.any():
+            self.place_mines(games[first], cells[first])
+            self.first_click[games[first]] = False
+
+        before = self.revealed.copy()
+        r, c = np.divmod(cells, self.columns)
+        hit = self.board[games, r, c] == -1
+        self.revealed[games, r, c] = True
+        self.game_over[games[hit]] = True
+
+        # sifir hucrelerden zincirleme ac
+        safe = games[~hit]
+        board = self.board[safe]
+        revealed = flood_reveal_batch(board, self.revealed[safe])
+        self.revealed[safe] = revealed
+
+        finished = ~np.any(~revealed & (board != -1), axis=(1, 2))
+        self.won[safe[finished]] = True
+        self.game_over[safe[finished]] = True
+
+        # bu adimda acilan hucreler (mayina basilan hucre dahil)
+        self.opened = self.revealed & ~before
+        self.total_moves += int(np.count_nonzero(self.opened))
+        self.safe_moves += int(np.count_nonzero(self.opened & (self.board != -1)))
+        return True
+
+    def run(self, policy):
+        while self.step(policy):
+            pass
+
+
+def simulate(policy, games, rows=4, columns=4, mines=3, batch_size=4096, seed=None):
+    # oyunlari gruplar halinde ayni anda oynat
+    rng = np.random.default_rng(seed)
+    wins = 0
+    total_moves = 0
+    safe_moves = 0
+    start = time.perf_counter()
+    for offset in range(0, games, batch_size):
+        simulator = LockstepSimulator(min(batch_size, games - offset), rows, columns, mines, seed=rng)
+        simulator.run(policy)
+        wins += int(simulator.won.sum())
+        total_moves += simulator.total_moves
+        safe_moves += simulator.safe_moves
+    return {
+        "games": games,
+        "wins": wins,
+        "total_moves": total_moves,
+        "safe_moves": safe_moves,
+        "elapsed": time.perf_counter() - start,
+    }
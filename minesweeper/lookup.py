@@ -0,0 +1,56 @@
+from itertools import combinations
+from math import comb
+
+import numpy as np
+
+from minesweeper.board import generate_boards, neighbor_counts
+from minesweeper.policy import ModelPolicy
+
+MAX_ENTRIES = 1 << 24
+SAMPLES = 100000
+
+
+def reachable_boards(rows=4, columns=4, mines=3, samples=SAMPLES, seed=None):
+    # kucuk tahtalarda tum mayin yerlesimleri, buyuklerde ornekleme
+    # ilk tiklamadan onceki bos tahta (hepsi 0) da eklenir
+    cells = rows * columns
+    if comb(cells, mines) <= samples:
+        mine_mask = np.zeros((comb(cells, mines), cells), dtype=bool)
+        for i, placement in enumerate(combinations(range(cells), mines)):
+            mine_mask[i, list(placement)] = True
+        boards = neighbor_counts(mine_mask.reshape(-1, rows, columns))
+    else:
+        _, boards = generate_boards(samples, rows, columns, mines, rng=seed)
+    return np.concatenate([np.zeros((1, rows, columns), dtype=np.int8), boards])
+
+
+class LookupPolicy(ModelPolicy):
+    # ozellik vektoru -> taban (max deger + 2) tamsayi anahtar -> onceden hesaplanmis guvenli olasiligi
+    def __init__(self, policy, rows=4, columns=4, mines=3, samples=SAMPLES, seed=None):
+        super().__init__(policy.model, policy.featurizer)
+        self.policy = policy
+        self.base = min(8, mines) + 2  # -1 (mayin / dolgu), 0 .. en buyuk sayi
+        entries = self.base ** self.featurizer.n_features
+        if entries > MAX_ENTRIES:
+            raise ValueError(f"lookup table would need {entries} entries for {self.featurizer.n_features} "
+                             f"features (limit {MAX_ENTRIES}); use CachedPolicy instead")
+        self.powers = self.base ** np.arange(self.featurizer.n_features, dtype=np.int64)
+
+        # ulasilabilir tum vektorleri tek seferde skorla, kalanlar NaN (ilk gorulduklerinde doldurulur)
+        self.table = np.full(entries, np.nan)
+        boards = reachable_boards(rows, columns, mines, samples, seed)
+        features = np.unique(self.featurizer.board_features(boards).reshape(-1, self.featurizer.n_features), axis=0)
+        self.table[self.encode(features)] = policy.predict_safe(features)
+        self.compiled = len(features)
+
+    def encode(self, features):
+        return (np.asarray(features, dtype=np.int64) + 1) @ self.powers
+
+    def predict_safe(self, features):
+        keys = self.encode(features)
+        scores = self.table[keys]
+        missing = np.isnan(scores)
+        if missing.any():
+            scores[missing] = self.policy.predict_safe(np.asarray(features)[missing])
+            self.table[keys[missing]] = scores[missing]
+        return scores
@@ -0,0 +1,24 @@
+import json
+import os
+
+DEFAULTS = {"radius": 1, "layout": "legacy"}
+
+
+def metadata_path(model_path):
+    # minesweeper_model.pkl -> minesweeper_model.json
+    return os.path.splitext(model_path)[0] + ".json"
+
+
+def save_metadata(model_path, **fields):
+    with open(metadata_path(model_path), "w") as file:
+        json.dump(fields, file, indent=2)
+
+
+def load_metadata(model_path):
+    # metadata dosyasi olmayan eski modeller 8 ozellikli legacy duzeni kullanir
+    metadata = dict(DEFAULTS)
+    path = metadata_path(model_path)
+    if os.path.exists(path):
+        with open(path) as file:
+            metadata.update(json.load(file))
+    return metadata
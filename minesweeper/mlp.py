@@ -0,0 +1,92 @@
+import argparse
+import os
+
+import numpy as np
+
+ACTIVATIONS = {
+    "linear": lambda x: x,
+    "relu": lambda x: np.maximum(x, 0),
+    "tanh": np.tanh,
+    "sigmoid": lambda x: 1 / (1 + np.exp(-x)),
+}
+
+
+def export_mlp(model, scaler=None):
+    # Keras Dense katmanlarinin agirliklari; StandardScaler ilk katmana gomulur:
+    # ((x - mean) / scale) @ W + b = x @ (W / scale) + (b - (mean / scale) @ W)
+    layers = []
+    for layer in model.layers:
+        if type(layer).__name__ != "Dense":
+            raise ValueError(f"only Dense layers can be exported, got {type(layer).__name__}")
+        activation = layer.get_config()["activation"]
+        if activation not in ACTIVATIONS:
+            raise ValueError(f"unsupported activation {activation!r}")
+        weights, bias = (np.asarray(array, dtype=np.float64) for array in layer.get_weights())
+        layers.append((weights, bias, activation))
+
+    if scaler is not None:
+        weights, bias, activation = layers[0]
+        mean = np.zeros(len(weights)) if scaler.mean_ is None else scaler.mean_
+        scale = np.ones(len(weights)) if scaler.scale_ is None else scaler.scale_
+        layers[0] = (weights / scale[:, None], bias - (mean / scale) @ weights, activation)
+    return NumpyMLP(layers)
+
+
+class NumpyMLP:
+    # TensorFlow olmadan ileri besleme; predict_proba sklearn modelleri gibi (n, 2) dondurur
+    def __init__(self, layers):
+        self.layers = layers
+
+    def save(self, path):
+        arrays = {}
+        for i, (weights, bias, activation) in enumerate(self.layers):
+            arrays[f"weights_{i}"] = weights
+            arrays[f"bias_{i}"] = bias
+            arrays[f"activation_{i}"] = np.array(activation)
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as arrays:
+            return cls([(arrays[f"weights_{i}"], arrays[f"bias_{i}"], str(arrays[f"activation_{i}"]))
+                        for i in range(len(arrays.files) // 3)])
+
+    def predict(self, features):
+        out = np.asarray(features, dtype=np.float64)
+        for weights, bias, activation in self.layers:
+            out = ACTIVATIONS[activation](out @ weights + bias)
+        return out
+
+    def predict_proba(self, features):
+        safe = self.predict(features)[:, 0]
+        return np.column_stack([1 - safe, safe])
+
+
+if __name__ == "__main__":
+    # Keras sadece aktarim sirasinda gerekir
+    import joblib
+    from keras.models import load_model
+
+    from minesweeper.datastore import DatasetReader, data_path
+    from minesweeper.metadata import load_metadata
+    from minesweeper.registry import model_path
+
+    parser = argparse.ArgumentParser(description="Keras modelini TensorFlow'suz NumPy dosyasina aktar")
+    parser.add_argument("--rows", type=int, default=10000, help="karsilastirma icin kullanilacak satir sayisi")
+    args = parser.parse_args()
+
+    source = model_path("nn")
+    directory = os.path.dirname(source)
+    model = load_model(source)
+    scaler = joblib.load(os.path.join(directory, "scaler.pkl"))
+    mlp = export_mlp(model, scaler)
+    out = model_path("nn-numpy")
+    mlp.save(out)
+
+    # ayni girdilerde Keras ciktisiyla karsilastir
+    meta = load_metadata(source)
+    X, _ = DatasetReader(data_path(meta["radius"], meta["layout"])).load()
+    X = np.asarray(X[:args.rows])
+    expected = model.predict(scaler.transform(X), verbose=0)[:, 0]
+    print(f"Saved {out}")
+    print(f"Max difference from Keras on {len(X)} rows: {np.abs(mlp.predict(X)[:, 0] - expected).max():.2e}")
@@ -0,0 +1,42 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from minesweeper.engine import MinesweeperEngine
+from minesweeper.evaluate import play_games
+from minesweeper.lockstep import simulate
+
+_policy = None
+
+
+def _init_worker(load_policy):
+    # model her islemde bir kez yuklenir
+    global _policy
+    _policy = load_policy()
+
+
+def _play_shard(games, rows, columns, mines, seed, lockstep, batch_size):
+    if lockstep:
+        return simulate(_policy, games, rows, columns, mines, batch_size=batch_size, seed=seed)
+    return play_games(MinesweeperEngine(rows, columns, mines), _policy, games, seed=seed)
+
+
+def parallel_evaluate(load_policy, games, workers=None, rows=4, columns=4, mines=3, seed=None,
+                      shard_size=1000, lockstep=False, batch_size=4096):
+    # parcalar isci sayisindan bagimsiz, her parcanin kendi tohumu var
+    shards = [min(shard_size, games - offset) for offset in range(0, games, shard_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(shards))
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(load_policy,)) as executor:
+        results = list(executor.map(_play_shard, shards, [rows] * len(shards), [columns] * len(shards),
+                                    [mines] * len(shards), seeds, [lockstep] * len(shards),
+                                    [batch_size] * len(shards)))
+    return {
+        "games": games,
+        "wins": sum(result["wins"] for result in results),
+        "total_moves": sum(result["total_moves"] for result in results),
+        "safe_moves": sum(result["safe_moves"] for result in results),
+        "elapsed": time.perf_counter() - start,
+    }
@@ -0,0 +1,72 @@
+import itertools
+import time
+
+import numpy as np
+import tensorflow as tf
+from sklearn.preprocessing import StandardScaler
+
+from minesweeper.dedup import deduplicate
+from minesweeper.incremental import CHUNK_ROWS, stream
+
+BATCH_SIZES = (32, 64, 128, 256, 512, 1024, 2048, 4096)
+
+
+def fit_scaler(reader, chunk_rows=CHUNK_ROWS, test_size=0.2, seed=42):
+    # olcekleyici egitim parcalari uzerinde tek geciste
+    scaler = StandardScaler()
+    for X_train, _, _, _ in stream(reader, chunk_rows, test_size, seed):
+        if len(X_train):
+            scaler.partial_fit(X_train)
+    if not getattr(scaler, "n_samples_seen_", 0):
+        raise ValueError(f"{reader.path} has no training rows")
+    return scaler
+
+
+def make_dataset(reader, scaler, batch_size, validation=False, dedup=False, shuffle=False,
+                 chunk_rows=CHUNK_ROWS, test_size=0.2, seed=42):
+    # depo parca parca okunur (incremental.stream ile ayni ayrim); bellekte en fazla bir parca bulunur
+    epochs = itertools.count()
+
+    def pieces():
+        rng = np.random.default_rng((seed, next(epochs)))  # her epoch farkli, tekrarlanabilir karistirma
+        for X_train, y_train, X_test, y_test in stream(reader, chunk_rows, test_size, seed):
+            X, y = (X_test, y_test) if validation else (X_train, y_train)
+            weights = np.ones(len(y), dtype=np.float32)
+            if dedup:
+                # parca icindeki tekrarlar tek satir + agirlik
+                X, y, weights = deduplicate(X, y)
+            if shuffle:
+                order = rng.permutation(len(y))
+                X, y, weights = X[order], y[order], weights[order]
+            if len(y):
+                yield X, y, weights.astype(np.float32)
+
+    signature = (tf.TensorSpec((None, reader.n_features), tf.int8), tf.TensorSpec((None,), tf.int8),
+                 tf.TensorSpec((None,), tf.float32))
+    dataset = tf.data.Dataset.from_generator(pieces, output_signature=signature).rebatch(batch_size)
+
+    # int8 satirlar yigin yigin float32'ye cevrilip olceklenir, verinin float64 kopyasi olusmaz
+    mean = scaler.mean_.astype(np.float32)
+    scale = scaler.scale_.astype(np.float32)
+    dataset = dataset.map(lambda x, y, w: ((tf.cast(x, tf.float32) - mean) / scale, y, w),
+                          num_parallel_calls=tf.data.AUTOTUNE)
+    return dataset.prefetch(tf.data.AUTOTUNE)
+
+
+def tune_batch_size(build_model, reader, scaler, n_rows, candidates=BATCH_SIZES, steps=20, tolerance=0.9):
+    # en yuksek hizin %90'ina ulasan en kucuk yigin boyutu (buyuk yigin genellemeyi bozabilir)
+    rates = {}
+    for batch_size in candidates:
+        if batch_size * (steps + 2) > n_rows:
+            break
+        model = build_model()
+        dataset = make_dataset(reader, scaler, batch_size)
+        model.fit(dataset.take(2), epochs=1, verbose=0)  # izleme / derleme
+        start = time.perf_counter()
+        model.fit(dataset.skip(2).take(steps), epochs=1, verbose=0)
+        rates[batch_size] = batch_size * steps / (time.perf_counter() - start)
+        print(f"Batch size {batch_size}: {rates[batch_size]:.0f} samples/s")
+    if not rates:
+        return candidates[0]
+    best = max(rates.values())
+    return min(batch_size for batch_size, rate in rates.items() if rate >= tolerance * best)
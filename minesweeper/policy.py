@@ -0,0 +1,69 @@
+import numpy as np
+
+from minesweeper.board import dilate, neighbor_sum
+from minesweeper.features import Featurizer
+
+
+class Policy:
+    # state: tek oyun (engine) ya da oyun yigini (LockstepSimulator); board, revealed ve rng alanlari olmali
+    def __init__(self, featurizer=None):
+        self.featurizer = featurizer or Featurizer()
+
+    def score_candidates(self, state, candidates):
+        raise NotImplementedError
+
+    def best_move(self, engine):
+        candidates = (~engine.revealed & ~engine.flagged).reshape(-1)
+        if not candidates.any():
+            return None
+        # tum adaylari tek seferde skorla
+        scores = np.full(candidates.shape, -np.inf)
+        scores[candidates] = self.score_candidates(engine, candidates)
+        return divmod(int(np.argmax(scores)), engine.columns)
+
+
+class ModelPolicy(Policy):
+    def __init__(self, model, featurizer=None):
+        super().__init__(featurizer)
+        self.model = model
+
+    def predict_safe(self, features):
+        # her satir icin guvenli olma olasiligi
+        return self.model.predict_proba(features)[:, 1]
+
+    def score_candidates(self, state, candidates):
+        return self.predict_safe(self.featurizer.candidate_features(state.board, candidates))
+
+
+class KerasPolicy(ModelPolicy):
+    def __init__(self, model, scaler, featurizer=None):
+        super().__init__(model, featurizer)
+        self.scaler = scaler
+
+    def predict_safe(self, features):
+        features = self.scaler.transform(features)  # Normalize features
+        return self.model.predict(features, verbose=0)[:, 0]
+
+
+class RandomPolicy(Policy):
+    def score_candidates(self, state, candidates):
+        return state.rng.random(int(np.count_nonzero(candidates)))
+
+
+class RuleBasedPolicy(Policy):
+    # sadece acik hucrelerdeki sayilara bakar
+    def score_candidates(self, state, candidates):
+        revealed = np.asarray(state.revealed)
+        hidden = ~revealed
+        numbers = np.where(revealed, state.board, 0)
+
+        # sayi = kapali komsu sayisi ise kapali komsularin hepsi mayin
+        mine_sources = revealed & (numbers > 0) & (numbers == neighbor_sum(hidden))
+        known_mines = hidden & dilate(mine_sources)
+        # sayi = bilinen mayin sayisi ise kalan kapali komsular guvenli
+        safe_sources = revealed & (numbers == neighbor_sum(known_mines))
+        known_safe = hidden & ~known_mines & dilate(safe_sources)
+
+        scores = 0.5 + 0.5 * known_safe - 0.5 * known_mines
+        scores = scores.reshape(candidates.shape)[candidates]
+        return scores + 1e-3 * state.rng.random(scores.shape)  # esitlikleri rastgele boz
@@ -0,0 +1,65 @@
+import importlib
+import os
+import time
+
+import numpy as np
+
+from minesweeper.datastore import ROOT
+from minesweeper.features import Featurizer
+from minesweeper.metadata import load_metadata
+from minesweeper.policy import KerasPolicy, ModelPolicy
+
+# ad -> (klasor, model dosyasi, cerceve); cerceve sadece o model istendiginde import edilir
+MODELS = {
+    "knn": ("KNN", "minesweeper_knn_model.pkl", "sklearn"),
+    "knn-hashed": ("KNN", "minesweeper_knn_model.pkl", "minesweeper.knn"),
+    "svm": ("SVM", "minesweeper_svm_model.pkl", "sklearn"),
+    "svm-approx": ("SVM", "minesweeper_svm_approx_model.pkl", "sklearn"),
+    "rf": ("Random Forest", "minesweeper_model.pkl", "sklearn"),
+    "rf-compiled": ("Random Forest", "minesweeper_model.npz", "minesweeper.forest"),
+    "gb": ("Gradient Boosting", "minesweeper_gb_model.pkl", "sklearn"),
+    "incremental": ("Incremental Learning", "minesweeper_incremental_model.pkl", "sklearn"),
+    "nn": ("Neural Networks", "minesweeper_nn_model.h5", "keras.models"),
+    "nn-numpy": ("Neural Networks", "minesweeper_nn_model.npz", "minesweeper.mlp"),
+}
+
+
+def model_path(name):
+    if name not in MODELS:
+        raise ValueError(f"unknown model {name!r}, expected one of {sorted(MODELS)}")
+    directory, filename, _ = MODELS[name]
+    return os.path.join(ROOT, directory, filename)
+
+
+def get_policy(name, report=False):
+    # model dosyalari calisma klasorunden degil, depo kokunden bulunur
+    path = model_path(name)
+    directory, _, framework = MODELS[name]
+
+    start = time.perf_counter()
+    module = importlib.import_module(framework)
+    import joblib
+    imported = time.perf_counter()
+
+    featurizer = Featurizer.from_metadata(load_metadata(path))
+    if framework == "keras.models":
+        scaler = joblib.load(os.path.join(ROOT, directory, "scaler.pkl"))
+        policy = KerasPolicy(module.load_model(path), scaler, featurizer)
+    elif framework == "minesweeper.mlp":
+        policy = ModelPolicy(module.NumpyMLP.load(path), featurizer)  # scaler ilk katmanda
+    elif framework == "minesweeper.knn":
+        policy = ModelPolicy(module.HashedKNN(joblib.load(path)), featurizer)
+    elif framework == "minesweeper.forest":
+        policy = ModelPolicy(module.CompiledForest.load(path), featurizer)
+    else:
+        policy = ModelPolicy(joblib.load(path), featurizer)
+    loaded = time.perf_counter()
+
+    # ilk tahmin (tembel baslatma, derleme) oyun suresine yansimasin
+    policy.predict_safe(np.zeros((1, featurizer.n_features), dtype=np.int8))
+    warmed = time.perf_counter()
+
+    if report:
+        print(f"{name}: import {imported - start:.2f}s, load {loaded - imported:.2f}s, "
+              f"warm-up {warmed - loaded:.2f}s")
+    return policy
@@ -0,0 +1,120 @@
+import argparse
+import itertools
+import os
+import time
+import warnings
+
+import numpy as np
+from joblib import Memory, Parallel, delayed
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.model_selection import KFold
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.neural_network import MLPClassifier
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+
+from minesweeper.datastore import ROOT, DatasetReader, data_path
+from minesweeper.features import Featurizer
+from minesweeper.lockstep import simulate
+from minesweeper.lookup import LookupPolicy
+from minesweeper.policy import ModelPolicy
+
+# sinir agi ailesi Keras yerine ayni katman yapisindaki MLPClassifier ile aranir
+GRIDS = {
+    "knn": {"n_neighbors": [1, 3, 5, 9, 15], "weights": ["uniform", "distance"]},
+    "svm": {"C": [0.1, 1, 10], "kernel": ["rbf", "poly"]},
+    "rf": {"n_estimators": [50, 100, 200], "max_depth": [None, 8, 16], "min_samples_leaf": [1, 5]},
+    "gb": {"learning_rate": [0.05, 0.1, 0.2], "max_leaf_nodes": [15, 31, 63]},
+    "nn": {"hidden_layer_sizes": [(32,), (64, 32), (128, 64)], "alpha": [1e-4, 1e-3]},
+}
+CACHE = os.path.join(ROOT, "data", "search_cache")
+
+
+def candidates(family):
+    grid = GRIDS[family]
+    return [dict(zip(grid, values)) for values in itertools.product(*grid.values())]
+
+
+def make_model(family, params, n_features=8):
+    if family == "knn":
+        return KNeighborsClassifier(**params)
+    if family == "svm":
+        return SVC(probability=True, random_state=42, **params)
+    if family == "rf":
+        return RandomForestClassifier(random_state=42, **params)
+    if family == "gb":
+        return HistGradientBoostingClassifier(categorical_features=[True] * n_features, random_state=42, **params)
+    if family == "nn":
+        return make_pipeline(StandardScaler(), MLPClassifier(max_iter=200, random_state=42, **params))
+    raise ValueError(f"family must be one of {sorted(GRIDS)}, got {family!r}")
+
+
+def fit_and_score(family, params, fold, folds, radius, layout, n_rows, games, seed):
+    # joblib.Memory ile diskte saklanir; n_rows depo buyudukce eski sonuclari gecersiz kilar
+    warnings.simplefilter(action='ignore', category=UserWarning)
+    featurizer = Featurizer(radius, layout)
+    X, y = DatasetReader(data_path(radius, layout)).load()
+    X, y = np.asarray(X[:n_rows]), np.asarray(y[:n_rows])
+    train, test = list(KFold(folds, shuffle=True, random_state=42).split(X))[fold]
+
+    model = make_model(family, params, featurizer.n_features)
+    start = time.perf_counter()
+    model.fit(X[train], y[train])
+    fit_time = time.perf_counter() - start
+
+    # sabit tahta kumesi: ayni seed, tum oyunlar ilk hamleyi birlikte yapar -> her aday ayni mayin anahtarlarini gorur
+    policy = ModelPolicy(model, featurizer)
+    try:
+        policy = LookupPolicy(policy)
+    except ValueError:
+        pass  # genis pencerelerde tablo sigmaz, model dogrudan kullanilir
+    stats = simulate(policy, games, seed=seed)
+    return {"accuracy": model.score(X[test], y[test]), "win_rate": stats["wins"] / games, "fit_time": fit_time}
+
+
+def search(family, folds=5, games=2000, seed=0, jobs=-1, cache=CACHE, radius=1, layout="legacy"):
+    # (aday, katman) isleri tum cekirdeklere dagitilir; yarida kalan arama onbellekten devam eder
+    cached = Memory(cache, verbose=0).cache(fit_and_score)
+    n_rows = DatasetReader(data_path(radius, layout)).n_rows
+    grid = candidates(family)
+    scores = Parallel(n_jobs=jobs)(delayed(cached)(family, params, fold, folds, radius, layout, n_rows, games, seed)
+                                   for params in grid for fold in range(folds))
+
+    results = []
+    for i, params in enumerate(grid):
+        fold_scores = scores[i * folds:(i + 1) * folds]
+        accuracy = np.array([score["accuracy"] for score in fold_scores])
+        win_rate = np.array([score["win_rate"] for score in fold_scores])
+        results.append({
+            "params": params,
+            "accuracy": accuracy.mean(),
+            "accuracy_std": accuracy.std(),
+            "win_rate": win_rate.mean(),
+            "win_rate_std": win_rate.std(),
+            "fit_time": np.mean([score["fit_time"] for score in fold_scores]),
+        })
+    return sorted(results, key=lambda result: (result["win_rate"], result["accuracy"]), reverse=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Capraz dogrulamali paralel hiperparametre aramasi")
+    parser.add_argument("family", choices=sorted(GRIDS))
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--games", type=int, default=2000, help="her katman modeli icin sabit tahta kumesindeki oyun sayisi")
+    parser.add_argument("--seed", type=int, default=0, help="tahta kumesinin tohumu")
+    parser.add_argument("--jobs", type=int, default=-1, help="paralel is sayisi (-1: tum cekirdekler)")
+    parser.add_argument("--cache", default=CACHE, help="katman sonuclarinin saklandigi klasor")
+    parser.add_argument("--radius", type=int, default=1)
+    parser.add_argument("--layout", default="legacy", choices=["legacy", "padded"])
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = search(args.family, args.folds, args.games, args.seed, args.jobs, args.cache, args.radius, args.layout)
+    print(f"{'Win %':>14} {'Accuracy %':>14} {'Fit (s)':>8}  Parameters")
+    for result in results:
+        print(f"{result['win_rate'] * 100:>7.2f} ±{result['win_rate_std'] * 100:5.2f} "
+              f"{result['accuracy'] * 100:>7.2f} ±{result['accuracy_std'] * 100:5.2f} "
+              f"{result['fit_time']:>8.2f}  {result['params']}")
+    print(f"Best: {results[0]['params']}")
+    print(f"Search time: {time.perf_counter() - start:.1f}s")
@@ -0,0 +1,63 @@
+import numpy as np
+from sklearn.kernel_approximation import Nystroem
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.svm import LinearSVC
+
+CHUNK_ROWS = 1 << 16
+
+
+class ApproximateSVM:
+    # Nystroem RBF ozellikleri + dogrusal SVM + ayri bolumde Platt kalibrasyonu
+    def __init__(self, kernel, linear, calibrator):
+        self.kernel = kernel
+        self.linear = linear
+        self.calibrator = calibrator
+        self.classes_ = linear.classes_
+
+    def decision_function(self, features):
+        return self.linear.decision_function(self.kernel.transform(features))
+
+    def predict_proba(self, features):
+        return self.calibrator.predict_proba(self.decision_function(features).reshape(-1, 1))
+
+    def predict(self, features):
+        return self.classes_[(self.decision_function(features) > 0).astype(int)]
+
+    def score(self, features, labels):
+        return float(np.mean(self.predict(features) == labels))
+
+
+def train_approximate_svm(features, labels, sample_weight=None, components=300, epochs=5, calibration=0.1,
+                          random_state=42):
+    rng = np.random.default_rng(random_state)
+    if sample_weight is None:
+        sample_weight = np.ones(len(labels))
+    classes = np.unique(labels)
+
+    # kalibrasyon satirlari dogrusal modelin gormedigi ayri bir bolum
+    order = rng.permutation(len(labels))
+    held_out = int(len(labels) * calibration)
+    calibrate, fit = order[:held_out], np.sort(order[held_out:])
+
+    # SVC(gamma="scale") ile ayni cekirdek genisligi; taban satirlari tekrarsiz satirlardan secilir
+    gamma = 1 / (features.shape[1] * np.var(features))
+    unique = np.unique(features, axis=0)
+    kernel = Nystroem(gamma=gamma, n_components=min(components, len(unique)), random_state=random_state)
+    kernel.fit(unique)
+
+    if len(fit) <= CHUNK_ROWS:
+        # bellege sigan (ornegin --dedup ile kuculmus) veride tam dogrusal SVM
+        linear = LinearSVC(dual=False, random_state=random_state)
+        linear.fit(kernel.transform(features[fit]), labels[fit], sample_weight=sample_weight[fit])
+    else:
+        # milyonlarca satir parca parca donusturulur, bellek sabit kalir
+        linear = SGDClassifier(loss="hinge", alpha=1e-5, random_state=random_state)
+        for _ in range(epochs):
+            for chunk in np.array_split(rng.permutation(fit), len(fit) // CHUNK_ROWS):
+                chunk = np.sort(chunk)
+                linear.partial_fit(kernel.transform(features[chunk]), labels[chunk], classes=classes,
+                                   sample_weight=sample_weight[chunk])
+
+    decision = linear.decision_function(kernel.transform(features[calibrate])).reshape(-1, 1)
+    calibrator = LogisticRegression().fit(decision, labels[calibrate], sample_weight=sample_weight[calibrate])
+    return ApproximateSVM(kernel, linear, calibrator)
@@ -0,0 +1,21 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+import pytest
+
+from minesweeper.datagen import play_and_log
+from minesweeper.features import Featurizer
+from minesweeper.policy import RandomPolicy
+
+
+@pytest.fixture(scope="session")
+def corpus():
+    # rastgele oyunlardan dataget.py biciminde sabit bir veri kumesi
+    featurizer = Featurizer()
+    X, y = play_and_log(RandomPolicy(featurizer), featurizer, 2000, seed=0)
+    # egitim satirlarinda olmayan ozellik vektorleri de sorgulanir
+    unseen = np.random.default_rng(0).integers(-1, 9, size=(500, featurizer.n_features)).astype(np.int8)
+    return X, y, unseen
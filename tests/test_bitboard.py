@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from minesweeper.bitboard import BitboardEngine
+from minesweeper.engine import MinesweeperEngine
+
+SIZES = [(4, 4, 3), (5, 7, 6), (8, 8, 10), (9, 9, 10), (16, 16, 40), (16, 30, 99)]
+
+
+def assert_same_state(engine, bitboard):
+    np.testing.assert_array_equal(engine.board, bitboard.board)
+    np.testing.assert_array_equal(engine.revealed, bitboard.revealed)
+    np.testing.assert_array_equal(engine.flagged, bitboard.flagged)
+    assert engine.mine_locations == bitboard.mine_locations
+    assert (engine.game_over, engine.won) == (bitboard.game_over, bitboard.won)
+    assert engine.legal_moves() == bitboard.legal_moves()
+
+
+def play(engine, bitboard, moves):
+    for move, r, c in moves:
+        if move == "reveal":
+            assert sorted(engine.reveal(r, c)) == sorted(bitboard.reveal(r, c))
+        else:
+            assert engine.flag(r, c) == bitboard.flag(r, c)
+        assert_same_state(engine, bitboard)
+
+
+@pytest.mark.parametrize("rows, columns, mines", SIZES)
+def test_bitboard_engine_matches_array_engine(rows, columns, mines):
+    # ayni tohum, ayni hamleler (acma, bayrak koyma, bayrak kaldirma) -> ayni tahta, ayni acilan hucreler
+    for seed in range(20):
+        engine = MinesweeperEngine(rows, columns, mines, seed=seed)
+        bitboard = BitboardEngine(rows, columns, mines, seed=seed)
+        moves = np.random.default_rng(seed)
+        while not engine.game_over:
+            legal = engine.legal_moves()
+            flagged = [(int(r), int(c)) for r, c in np.argwhere(engine.flagged)]
+            draw = moves.random()
+            if flagged and (draw < 0.1 or not legal):
+                r, c = flagged[moves.integers(len(flagged))]
+                play(engine, bitboard, [("flag", r, c)])
+            elif draw < 0.25:
+                r, c = legal[moves.integers(len(legal))]
+                play(engine, bitboard, [("flag", r, c)])
+            else:
+                r, c = legal[moves.integers(len(legal))]
+                play(engine, bitboard, [("reveal", r, c)])
+        np.testing.assert_array_equal(engine.features(), bitboard.features())
+
+
+def test_flood_skips_revealed_zeros():
+    # (7, 6) yayilimi durdurur, sonra bayragi kaldirilir; (2, 1) acilinca acik sifirlardan tekrar yayilinmamali
+    engine = MinesweeperEngine(8, 8, 6, seed=2535)
+    bitboard = BitboardEngine(8, 8, 6, seed=2535)
+    play(engine, bitboard, [("flag", 7, 6), ("flag", 2, 1), ("reveal", 6, 5), ("flag", 7, 6), ("flag", 2, 1),
+                            ("flag", 6, 7)])
+    assert engine.reveal(2, 1) == bitboard.reveal(2, 1) == [(2, 1)]
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from minesweeper.datastore import DatasetReader, DatasetWriter
+
+
+def test_append_keeps_rows_in_order(tmp_path):
+    path = str(tmp_path)
+    rng = np.random.default_rng(0)
+    X = rng.integers(-1, 9, size=(31, 8)).astype(np.int8)
+    y = rng.integers(0, 2, size=31).astype(np.int8)
+    for start, stop in ((0, 3), (3, 7), (7, 22), (22, 22), (22, 31)):
+        DatasetWriter(path, 8, chunk_rows=10, radius=1, layout="legacy").append(X[start:stop], y[start:stop])
+    reader = DatasetReader(path)
+    assert reader.n_rows == 31
+    np.testing.assert_array_equal(reader.load()[0], X)
+
+    # birlestirme sonrasi ayni satirlar, daha az parca
+    assert DatasetWriter(path, 8, chunk_rows=10).compact() > 0
+    features, labels = DatasetReader(path).load()
+    rows = sorted(map(bytes, np.column_stack([features, labels])))
+    assert rows == sorted(map(bytes, np.column_stack([X, y])))
+
+
+@pytest.mark.parametrize("metadata", [{"layout": "padded"}, {"radius": 2}])
+def test_reopen_rejects_different_metadata(tmp_path, metadata):
+    path = str(tmp_path)
+    DatasetWriter(path, 8, radius=1, layout="legacy")
+    with pytest.raises(ValueError, match="stores"):
+        DatasetWriter(path, 8, **metadata)
@@ -0,0 +1,16 @@
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+from minesweeper.forest import UNIQUE_ROWS, CompiledForest, compile_forest
+
+
+def test_compiled_forest_matches_scikit_learn(corpus, tmp_path):
+    X, y, unseen = corpus
+    model = RandomForestClassifier(n_estimators=20, min_samples_leaf=2, random_state=0).fit(X, y)
+    path = str(tmp_path / "forest.npz")
+    compile_forest(model).save(path)
+    forest = CompiledForest.load(path)
+
+    # kucuk yiginlar dogrudan, buyuk yiginlar benzersiz satirlar uzerinden hesaplanir
+    for features in (X[:16], X[:UNIQUE_ROWS * 4], unseen[:16], unseen):
+        np.testing.assert_array_equal(forest.predict_proba(features), model.predict_proba(features))
@@ -0,0 +1,20 @@
+import pytest
+
+from minesweeper.datastore import DatasetReader, DatasetWriter
+from minesweeper.incremental import LEARNERS, train_incremental
+
+
+@pytest.mark.parametrize("learner", LEARNERS)
+def test_empty_store_raises(tmp_path, learner):
+    DatasetWriter(str(tmp_path), 8)
+    with pytest.raises(ValueError, match="no training rows"):
+        train_incremental(DatasetReader(str(tmp_path)), learner)
+
+
+@pytest.mark.parametrize("learner", LEARNERS)
+def test_trained_pipeline_predicts(corpus, tmp_path, learner):
+    X, y, unseen = corpus
+    DatasetWriter(str(tmp_path), X.shape[1]).append(X, y)
+    pipeline, accuracy = train_incremental(DatasetReader(str(tmp_path)), learner, epochs=1, chunk_rows=4096)
+    assert accuracy > 0.8
+    assert pipeline.predict_proba(unseen).shape == (len(unseen), 2)
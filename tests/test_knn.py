@@ -0,0 +1,16 @@
+import numpy as np
+import pytest
+from sklearn.neighbors import KNeighborsClassifier
+
+from minesweeper.knn import HashedKNN
+
+
+@pytest.mark.parametrize("weights", ["uniform", "distance"])
+@pytest.mark.parametrize("k", [1, 4, 5, 6])
+def test_hashed_knn_matches_scikit_learn(corpus, k, weights):
+    X, y, unseen = corpus
+    model = KNeighborsClassifier(n_neighbors=k, weights=weights).fit(X, y)
+    knn = HashedKNN(model)
+    # tablodan cevaplanan satirlar, gorulmemis satirlar ve ikisinin karisimi
+    for features in (X[:2000], unseen, np.concatenate([unseen[:50], X[:50]])):
+        np.testing.assert_array_equal(knn.predict_proba(features), model.predict_proba(features))